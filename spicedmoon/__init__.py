@@ -1,24 +1,53 @@
 """
 Calculation of observer-lunar geometries using NASA's SPICE toolbox.
 """
+from importlib import import_module as _import_module
 from typing import TYPE_CHECKING as _TYPE_CHECKING
 
-from .custombody.preexisting import get_moon_datas_from_extra_kernels
-from .geometry import (
-    get_moon_datas_xyzs, get_moon_datas_llhs
-)
-from .custombody.geotic import get_moon_datas
-from .custombody.selenic import get_moon_datas_from_moon
-from .heliac import get_sun_moon_datas
-from .types import MoonData, MoonSunData
+from .types import MoonData, MoonDataBatch, MoonSunData
+
+# Public functions are only imported on first access, so that importing the package
+# doesn't load spiceypy and every SPICE-based submodule up front.
+_LAZY_ATTRIBUTES = {
+    "get_moon_datas_from_extra_kernels": ".custombody.preexisting",
+    "get_moon_datas_from_extra_kernels_bulk": ".custombody.preexisting",
+    "get_moon_datas_xyzs": ".geometry",
+    "get_moon_datas_llhs": ".geometry",
+    "get_moon_datas": ".custombody.geotic",
+    "get_moon_datas_bulk": ".custombody.geotic",
+    "get_moon_datas_from_moon": ".custombody.selenic",
+    "get_sun_moon_datas": ".heliac",
+    "SpiceKernelContext": ".basics",
+    "load_kernels": ".basics",
+    "clear_kernels": ".basics",
+}
+
+__all__ = ["MoonData", "MoonDataBatch", "MoonSunData", *_LAZY_ATTRIBUTES]
 
 
 def __getattr__(name):
     if name == "spicedmoon":
         from . import deprecated as _spicedmoon
         return _spicedmoon
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(_import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
 if _TYPE_CHECKING:
     from . import deprecated
+    from .custombody.preexisting import (
+        get_moon_datas_from_extra_kernels,
+        get_moon_datas_from_extra_kernels_bulk,
+    )
+    from .geometry import get_moon_datas_xyzs, get_moon_datas_llhs
+    from .custombody.geotic import get_moon_datas, get_moon_datas_bulk
+    from .custombody.selenic import get_moon_datas_from_moon
+    from .heliac import get_sun_moon_datas
+    from .basics import SpiceKernelContext, load_kernels, clear_kernels
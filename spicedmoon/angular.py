@@ -1,7 +1,7 @@
 """
 Compute angular coordinates like zenith and azimuth, and related calculations.
 """
-from typing import Tuple, overload
+from typing import Tuple, Union, overload
 
 import numpy as np
 import spiceypy as spice
@@ -67,58 +67,121 @@ def get_zn_az(
         Azimuth of the target in decimal degrees, measured from North towards East:
         0 deg = North, 90 deg = East, 180 deg = South, 270 deg = West.
     """
+    bf2tp = None
     if not in_sez:
-        if longitude is None or latitude is None:
-            raise ValueError(
-                "latitude and longitude must be provided when `in_sez` is False"
-            )
-        colat = get_colat_deg(latitude)
-        lon_rad = ((longitude % 180) + 180) * spice.rpd()
-        colat_rad = colat * spice.rpd()
-        bf2tp = spice.eul2m(-lon_rad, -colat_rad, 0, 3, 2, 3)
+        bf2tp = _get_bf2tp(latitude, longitude)
+    return _get_zn_az_bf2tp(state_pos_zenith, bf2tp)
+
+
+def _get_bf2tp(latitude: float, longitude: float) -> np.ndarray:
+    # Rotation from the body-fixed frame into the observer's SEZ frame
+    if longitude is None or latitude is None:
+        raise ValueError(
+            "latitude and longitude must be provided when `in_sez` is False"
+        )
+    colat = get_colat_deg(latitude)
+    lon_rad = np.radians((longitude % 180) + 180)
+    colat_rad = np.radians(colat)
+    return spice.eul2m(-lon_rad, -colat_rad, 0, 3, 2, 3)
+
+
+def _get_zn_az_bf2tp(
+    state_pos_zenith: np.ndarray, bf2tp: np.ndarray = None
+) -> Tuple[float, float]:
+    # Same as `get_zn_az`, with the SEZ rotation already computed (None if in SEZ)
+    if bf2tp is not None:
         state_pos_zenith = spice.mtxv(bf2tp, state_pos_zenith)
     _, longi, lati = spice.reclat(state_pos_zenith)
-    zenith = 90.0 - lati * spice.dpr()
-    azimuth = 180 - longi * spice.dpr()
+    zenith = 90.0 - np.degrees(lati)
+    azimuth = 180 - np.degrees(longi)
     return zenith, azimuth
 
 
+def _get_bf2tps(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    # Vectorized `_get_bf2tp`, with one (3, 3) rotation per latitude and longitude.
+    # Same matrices as eul2m(-lon, -colat, 0, 3, 2, 3), that is R3(-lon) @ R2(-colat)
+    colats_rad = np.radians(get_colat_deg(np.asarray(latitudes, dtype=np.float64)))
+    lons_rad = np.radians((np.asarray(longitudes, dtype=np.float64) % 180) + 180)
+    cos_lon, sin_lon = np.cos(lons_rad), np.sin(lons_rad)
+    cos_colat, sin_colat = np.cos(colats_rad), np.sin(colats_rad)
+    zeros = np.zeros_like(lons_rad)
+    ones = np.ones_like(lons_rad)
+    rot_lon = np.stack(
+        [
+            np.stack([cos_lon, -sin_lon, zeros], axis=-1),
+            np.stack([sin_lon, cos_lon, zeros], axis=-1),
+            np.stack([zeros, zeros, ones], axis=-1),
+        ],
+        axis=-2,
+    )
+    rot_colat = np.stack(
+        [
+            np.stack([cos_colat, zeros, sin_colat], axis=-1),
+            np.stack([zeros, ones, zeros], axis=-1),
+            np.stack([-sin_colat, zeros, cos_colat], axis=-1),
+        ],
+        axis=-2,
+    )
+    return rot_lon @ rot_colat
+
+
+def _get_zn_azs_bf2tps(
+    states_pos_zenith: np.ndarray, bf2tps: np.ndarray = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Vectorized `_get_zn_az_bf2tp`. `bf2tps` is either one (3, 3) rotation shared by
+    # all positions, one rotation per position (N, 3, 3), or None if already in SEZ.
+    states_pos_zenith = np.asarray(states_pos_zenith, dtype=np.float64)
+    if bf2tps is not None:
+        states_pos_zenith = np.einsum("...ji,...j->...i", bf2tps, states_pos_zenith)
+    x, y, z = states_pos_zenith[:, 0], states_pos_zenith[:, 1], states_pos_zenith[:, 2]
+    lats = np.arctan2(z, np.hypot(x, y))
+    longs = np.arctan2(y, x)
+    zeniths = 90.0 - np.degrees(lats)
+    azimuths = 180 - np.degrees(longs)
+    return zeniths, azimuths
+
+
 def get_colat_deg(lat_deg: float) -> float:
     """
     Convert the latitude into colatitude.
 
     Parameters
     ----------
-    lat: float
+    lat: float | np.ndarray
         Latitude in decimal degrees
 
     Returns
     -------
-    colat: float
+    colat: float | np.ndarray
         Colatitude associated to `lat`.
     """
     return 90 - (lat_deg % 90)
 
 
-def get_phase_sign(sun_lon_rad: float, obs_lon_rad: float):
+def get_phase_sign(
+    sun_lon_rad: Union[float, np.ndarray], obs_lon_rad: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
     """
     Get the sign of a moon phase angle, based on observer's and sun's selenographic longitude
 
+    Arrays of longitudes are accepted, giving one sign per element.
+
     Parameters
     ----------
-    sun_lon_rad: float
+    sun_lon_rad: float | np.ndarray
         Selenographic longitude of the sun in radians.
-    obs_lon_rad: float
+    obs_lon_rad: float | np.ndarray
         Selenographic longitude of the observer in radians.
 
     Returns
     -------
-    s: float
+    s: float | np.ndarray
         Sign of the moon phase angle. -1 or 1.
     """
-    dlon = sun_lon_rad - obs_lon_rad
+    dlon = np.subtract(sun_lon_rad, obs_lon_rad)
     dlon = np.arctan2(np.sin(dlon), np.cos(dlon))
     s = np.sign(-np.sin(dlon))
-    if s == 0:
-        s = 1.0
+    s = np.where(s == 0, 1.0, s)
+    if s.ndim == 0:
+        return float(s)
     return s
@@ -1,14 +1,27 @@
 """
 Common basic functions that help and improve in SPICE usage.
 """
+import os
 import time
-from typing import List, Union, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import Callable, List, Union, Tuple
 from datetime import datetime, timezone
 import warnings
 
+import numpy as np
 import spiceypy as spice
 
-from .constants import MOON_EQ_RAD, MOON_POL_RAD
+from .constants import BASIC_KERNELS, MOON_EQ_RAD, MOON_POL_RAD, MOON_KERNELS
+
+_KM_PER_AU = spice.convrt(1.0, "AU", "KM")
+# Number of loaded text kernels (the leapseconds kernel among them) the cached
+# str2et conversions were computed with, None if unknown
+_str2et_ktotal = None
+# Numbers of loaded text (frames), PCK and CK kernels the cached pxform rotations
+# were computed with, None if unknown
+_pxform_ktotals = None
 
 
 def furnsh_safer(k_path: str):
@@ -26,6 +39,260 @@ def furnsh_safer(k_path: str):
     except Exception:
         time.sleep(2)
         spice.furnsh(k_path)
+    _check_spice_caches()
+
+
+def _kclear():
+    """Perform SPICE's `kclear_c`, also dropping the values cached from the old kernels."""
+    _clear_spice_caches()
+    spice.kclear()
+
+
+def _unload(k_path: str):
+    """Perform SPICE's `unload_c`, also dropping the cached values the kernel affected."""
+    spice.unload(k_path)
+    _check_spice_caches()
+
+
+def _clear_spice_caches():
+    global _str2et_ktotal, _pxform_ktotals
+    _str2et_ktotal = None
+    _pxform_ktotals = None
+    _str2et_cached.cache_clear()
+    _pxform_cached.cache_clear()
+
+
+def _check_spice_caches():
+    """
+    Drop the cached values that the kernels loaded or unloaded since the last check can
+    change.
+
+    The str2et conversions only depend on the leapseconds kernel (a text kernel), and
+    the pxform rotations on the frame, PCK and CK kernels, so loading or unloading
+    SPKs (e.g. the ones of the custom bodies) keeps both caches.
+    """
+    global _str2et_ktotal, _pxform_ktotals
+    text_ktotal = spice.ktotal("TEXT")
+    if text_ktotal != _str2et_ktotal:
+        _str2et_cached.cache_clear()
+        _str2et_ktotal = text_ktotal
+    pxform_ktotals = (text_ktotal, spice.ktotal("PCK"), spice.ktotal("CK"))
+    if pxform_ktotals != _pxform_ktotals:
+        _pxform_cached.cache_clear()
+        _pxform_ktotals = pxform_ktotals
+
+
+@lru_cache(maxsize=4096)
+def _str2et_cached(utc_time: str) -> float:
+    return spice.str2et(utc_time)
+
+
+@lru_cache(maxsize=8192)
+def _pxform_cached(source_frame: str, target_frame: str, et: float) -> np.ndarray:
+    # Floats hash by their exact value, so only identical ets share a rotation.
+    # The cached matrix is read-only, as every caller gets the same object.
+    rotation = spice.pxform(source_frame, target_frame, et)
+    rotation.flags.writeable = False
+    return rotation
+
+
+def _str2ets(utc_times: List[str]) -> np.ndarray:
+    """
+    Convert UTC strings into ets, parsing each distinct string only once.
+
+    The conversions are cached between calls, and the cache is dropped whenever the
+    number of loaded text kernels, which include the leapseconds kernel, changes.
+
+    Parameters
+    ----------
+    utc_times : list of str
+        Timestamps in a valid UTC format allowed by SPICE.
+
+    Returns
+    -------
+    ets : np.ndarray of float
+        TDB seconds past J2000 of each timestamp.
+    """
+    unique_times, inverse = np.unique(
+        np.asarray(utc_times, dtype=str), return_inverse=True
+    )
+    unique_ets = np.array([_str2et_cached(utc_time) for utc_time in unique_times])
+    return unique_ets[inverse.reshape(-1)].astype(np.float64)
+
+
+def _is_kernel_loaded(k_path: str) -> bool:
+    with spice.no_found_check():
+        _, _, _, found = spice.kinfo(k_path)
+    return found
+
+
+class SpiceKernelContext:
+    """
+    Context manager that loads SPICE kernels, skipping the ones that are already loaded.
+
+    Contexts can be nested, and only the outermost one clears the kernel pool on exit.
+    Wrapping several `spicedmoon` calls in one context makes them share the loaded kernels
+    instead of loading and clearing them on every call. After `load_kernels` no context
+    clears the pool, until `clear_kernels` is called.
+
+    Entering a context drops the SPICE values cached by `spicedmoon` if the number of
+    loaded text, PCK or CK kernels changed. Kernels swapped directly with `spiceypy`
+    without changing those numbers (e.g. unloading one and loading another) go
+    unnoticed, so they must be changed through `spicedmoon` (`clear_kernels`,
+    `load_kernels`) instead.
+
+    Parameters
+    ----------
+    k_paths : list of str
+        Paths of the kernels to load.
+    clear_on_exit : bool
+        If True, the kernel pool is cleared (`kclear`) when leaving the outermost context.
+        True by default.
+    """
+
+    _depth = 0
+    _keep_loaded = False
+
+    def __init__(self, k_paths: List[str], clear_on_exit: bool = True):
+        self.k_paths = list(k_paths)
+        self.clear_on_exit = clear_on_exit
+
+    def __enter__(self) -> "SpiceKernelContext":
+        for k_path in self.k_paths:
+            if not _is_kernel_loaded(k_path):
+                furnsh_safer(k_path)
+        _check_spice_caches()
+        SpiceKernelContext._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        SpiceKernelContext._depth -= 1
+        if (
+            self.clear_on_exit
+            and SpiceKernelContext._depth == 0
+            and not SpiceKernelContext._keep_loaded
+        ):
+            _kclear()
+        return False
+
+
+def load_kernels(kernels_path: str, extra_k_paths: List[str] = None):
+    """
+    Load the SPICE kernels used by `spicedmoon` and keep them loaded between calls.
+
+    The functions that receive a `kernels_path` won't load or clear those kernels again,
+    and the kernels any of them loads stay loaded as well, until `clear_kernels` is
+    called. While they are loaded, other kernels should be loaded or unloaded through
+    `spicedmoon` too, as the values it caches from SPICE are only dropped then, or when
+    the number of loaded text, PCK or CK kernels changes.
+
+    Parameters
+    ----------
+    kernels_path : str
+        Path where the SPICE kernels are stored.
+    extra_k_paths : list of str
+        Paths of other kernels to load too. Optional.
+    """
+    k_paths = [
+        os.path.join(kernels_path, kernel) for kernel in BASIC_KERNELS + MOON_KERNELS
+    ]
+    if extra_k_paths is not None:
+        k_paths += list(extra_k_paths)
+    with SpiceKernelContext(k_paths, clear_on_exit=False):
+        SpiceKernelContext._keep_loaded = True
+
+
+def clear_kernels():
+    """
+    Clear the SPICE kernel pool, including the kernels kept by `load_kernels`.
+
+    Afterwards, each `spicedmoon` call loads and clears its kernels again.
+    """
+    SpiceKernelContext._keep_loaded = False
+    _kclear()
+
+
+def _init_worker(k_paths: List[str]):
+    """
+    Load the kernels in a clean kernel pool. Initializer of each worker process, which
+    must have its own SPICE kernel pool, so the kernels are loaded once per worker
+    instead of once per batch.
+
+    Parameters
+    ----------
+    k_paths : list of str
+        Paths of the kernels to load.
+    """
+    # A forked worker inherits the kernel pool of the parent process
+    _kclear()
+    for k_path in k_paths:
+        furnsh_safer(k_path)
+
+
+def _call(func: Callable, args: tuple):
+    return func(*args)
+
+
+def _split_batches(n_elements: int, n_batches: int) -> List[slice]:
+    """
+    Split `n_elements` consecutive elements into at most `n_batches` contiguous slices.
+
+    Parameters
+    ----------
+    n_elements : int
+        Number of elements to split.
+    n_batches : int
+        Maximum number of batches.
+
+    Returns
+    -------
+    batches : list of slice
+        Non-empty slices covering all the elements, in order.
+    """
+    n_batches = max(1, min(n_batches, n_elements))
+    size, extra = divmod(n_elements, n_batches)
+    batches = []
+    start = 0
+    for i in range(n_batches):
+        end = start + size + (1 if i < extra else 0)
+        batches.append(slice(start, end))
+        start = end
+    return batches
+
+
+def _run_in_processes(
+    func: Callable,
+    k_paths: List[str],
+    batches_args: List[tuple],
+    num_workers: int,
+) -> List:
+    """
+    Call `func` for each batch of arguments in a pool of worker processes.
+
+    CSPICE keeps a global state that can't be shared between threads, so each worker
+    loads its own copy of the kernels when it starts, before calling `func`.
+
+    Parameters
+    ----------
+    func : callable
+        Module-level function to call.
+    k_paths : list of str
+        Paths of the kernels each worker has to load.
+    batches_args : list of tuple
+        Positional arguments of `func` for each batch.
+    num_workers : int
+        Number of worker processes.
+
+    Returns
+    -------
+    results : list
+        Values returned for each batch, in order.
+    """
+    with ProcessPoolExecutor(
+        max_workers=num_workers, initializer=_init_worker, initargs=(k_paths,)
+    ) as executor:
+        results = executor.map(_call, repeat(func), batches_args)
+        return list(results)
 
 
 def _is_dt_tz_aware(dt: datetime) -> bool:
@@ -59,6 +326,15 @@ def dt_to_str(dts: Union[List[datetime], List[str]]) -> List[str]:
     utc_times: list of str
         List of the timestamps in a valid `str` format for SPICE.
     """
+    if len(dts) > 0 and all(isinstance(dt, datetime) for dt in dts):
+        if not all(_is_dt_tz_aware(dt) for dt in dts):
+            warnings.warn("Using timezone-naive datetime object", RuntimeWarning)
+        # Whole seconds since the epoch, formatted in a single numpy call
+        secs = np.array(
+            [dt.replace(microsecond=0).timestamp() for dt in dts], dtype=np.int64
+        )
+        utc_times = np.datetime_as_string(secs.astype("datetime64[s]"), unit="s")
+        return np.char.replace(utc_times, "T", " ").tolist()
     utc_times = []
     for dt in dts:
         if isinstance(dt, datetime):
@@ -6,11 +6,13 @@ from typing import List, Tuple
 import spiceypy as spice
 import numpy as np
 
+from .basics import _pxform_cached
+
 
 def to_rectangular_same_frame(
     latlonheights: List[Tuple[float, float, float]],
     body: str,
-) -> List[List[float]]:
+) -> np.ndarray:
     """Convert planetographic coordinates to rectangular, using the same reference frame.
 
     Parameters
@@ -25,26 +27,17 @@ def to_rectangular_same_frame(
 
     Returns
     -------
-    pos: list of list of float
-        Each inner list has 3 values: The rectangular coordinates in kilometers.
+    pos: np.ndarray of float
+        Array of shape (N, 3). Each row has the rectangular coordinates in kilometers.
     """
     _, radios = spice.bodvrd(body, "RADII", 3)
     eq_rad = radios[0]  # Equatorial Radius
     pol_rad = radios[2]  # Polar radius
     flattening = (eq_rad - pol_rad) / eq_rad
-    poss_iaus = []
-    for llh in latlonheights:
-        pos_iau = spice.pgrrec(
-            body,
-            spice.rpd() * llh[1],
-            spice.rpd() * llh[0],
-            llh[2],
-            eq_rad,
-            flattening,
-        )
-        poss_iaus.append(pos_iau)
-    poss_iaus = list(map(lambda n: n, poss_iaus))
-    return poss_iaus
+    llhs = np.asarray(latlonheights, dtype=np.float64).reshape(-1, 3)
+    lats_rad = np.radians(llhs[:, 0])
+    lons_rad = np.radians(llhs[:, 1])
+    return _pgrrec_np(body, lons_rad, lats_rad, llhs[:, 2], eq_rad, flattening)
 
 
 def to_planetographic_same_frame(
@@ -68,41 +61,119 @@ def to_planetographic_same_frame(
         - lon: Longitude in decimal degrees
         - hhh: Height (distance to surface) in kilometers
     """
+    xyzs = np.asarray(xyz_list, dtype=np.float64).reshape(-1, 3)
+    return _to_planetographic_degrees(xyzs, body).tolist()
+
+
+def _to_planetographic_degrees(xyzs: np.ndarray, body: str) -> np.ndarray:
+    # Rows of latitude (deg), longitude (deg, in [-180, 180]) and height (km)
     _, radii = spice.bodvrd(body, "RADII", 3)
     eq_rad = radii[0]  # Equatorial Radius
     pol_rad = radii[2]  # Polar radius
     flattening = (eq_rad - pol_rad) / eq_rad
-    llh_list = []
-    for xyz in xyz_list:
-        pos_iau = np.array(list(xyz))
-        llh = spice.recpgr(body, pos_iau, eq_rad, flattening)
-        llh_list.append(llh)
-    for i, llh in enumerate(llh_list):
-        lat = llh[1] * spice.dpr()
-        lon = llh[0] * spice.dpr()
-        alt = llh[2]
-        while lon < -180:
-            lon += 360
-        while lon > 180:
-            lon -= 360
-        llh_list[i] = (lat, lon, alt)
-    return llh_list
+    lons, lats, hhhs = _recpgr_np(body, xyzs, eq_rad, flattening)
+    lats = np.degrees(lats)
+    lons = _wrap_longitude(np.degrees(lons))
+    return np.column_stack((lats, lons, hhhs))
+
+
+# SPICE always uses positive east planetographic longitudes for these bodies
+_EAST_POSITIVE_BODIES = {"EARTH", "MOON", "SUN", "399", "301", "10"}
+
+
+def _longitude_sign(body: str) -> float:
+    # Planetographic longitude is positive west for most prograde bodies; probe
+    # SPICE once instead of replicating its body-specific rules.
+    if body.strip().upper() in _EAST_POSITIVE_BODIES:
+        return 1.0
+    return 1.0 if spice.pgrrec(body, 1.0, 0.0, 0.0, 1.0, 0.0)[1] > 0 else -1.0
+
+
+def _pgrrec_np(
+    body: str,
+    lons_rad: np.ndarray,
+    lats_rad: np.ndarray,
+    alts: np.ndarray,
+    eq_rad: float,
+    flattening: float,
+) -> np.ndarray:
+    """Vectorized equivalent of `spice.pgrrec`. Returns an array of shape (N, 3)."""
+    lons_rad = _longitude_sign(body) * np.asarray(lons_rad, dtype=np.float64)
+    lats_rad = np.asarray(lats_rad, dtype=np.float64)
+    e2 = flattening * (2 - flattening)
+    sin_lat = np.sin(lats_rad)
+    n_rad = eq_rad / np.sqrt(1 - e2 * sin_lat**2)
+    cos_lat = (n_rad + alts) * np.cos(lats_rad)
+    return np.column_stack(
+        (
+            cos_lat * np.cos(lons_rad),
+            cos_lat * np.sin(lons_rad),
+            (n_rad * (1 - e2) + alts) * sin_lat,
+        )
+    )
+
+
+def _recpgr_np(
+    body: str, rectans: np.ndarray, eq_rad: float, flattening: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized equivalent of `spice.recpgr`, using Bowring's iterative method.
+
+    Points near the body centre fall back to `spice.recgeo`.
+    Returns the longitudes (in [0, 2pi) radians), latitudes (radians) and altitudes.
+    """
+    rectans = np.asarray(rectans, dtype=np.float64).reshape(-1, 3)
+    x, y, z = rectans[:, 0], rectans[:, 1], rectans[:, 2]
+    pol_rad = eq_rad * (1 - flattening)
+    e2 = flattening * (2 - flattening)
+    ep2 = e2 / (1 - flattening) ** 2
+    p = np.hypot(x, y)
+    beta = np.arctan2(z, (1 - flattening) * p)
+    for _ in range(3):
+        lats = np.arctan2(
+            z + ep2 * pol_rad * np.sin(beta) ** 3, p - e2 * eq_rad * np.cos(beta) ** 3
+        )
+        beta = np.arctan2((1 - flattening) * np.sin(lats), np.cos(lats))
+    sin_lat = np.sin(lats)
+    alts = p * np.cos(lats) + z * sin_lat - eq_rad * np.sqrt(1 - e2 * sin_lat**2)
+    lons = _longitude_sign(body) * np.arctan2(y, x)
+    lons = np.where(lons < 0, lons + 2 * np.pi, lons)
+    # Three iterations of Bowring's method don't converge near the body centre,
+    # so the few points closer than a handful of e2 * eq_rad are solved by SPICE
+    near_centre = np.flatnonzero(np.hypot(p, z) <= 4 * e2 * eq_rad)
+    for i in near_centre:
+        _, lats[i], alts[i] = spice.recgeo(rectans[i], eq_rad, flattening)
+    return lons, lats, alts
+
+
+def _pxforms(source_frame: str, target_frame: str, ets: np.ndarray) -> np.ndarray:
+    # Several points often share the same epoch, so each distinct et is only
+    # sent to SPICE once, and rotations already computed by earlier calls are reused.
+    unique_ets, inverse = np.unique(
+        np.asarray(ets, dtype=np.float64), return_inverse=True
+    )
+    rotations = np.array(
+        [_pxform_cached(source_frame, target_frame, et) for et in unique_ets]
+    )
+    return rotations[inverse.reshape(-1)]
 
 
 def _change_frames(
-    coords: np.ndarray, source_frame: str, target_frame: str, et: float
+    coords: np.ndarray,
+    source_frame: str,
+    target_frame: str,
+    ets: np.ndarray,
+    rotations: np.ndarray = None,
 ) -> np.ndarray:
-    if "MOON" not in target_frame:
-        trans_matrix = spice.pxform(source_frame, target_frame, et)
-        return spice.mxv(trans_matrix, coords)
-    moon_pos_satref, _ = spice.spkpos("MOON", et, source_frame, "NONE", "EARTH")
-    rotation = spice.pxform(source_frame, target_frame, et)
-    # set moon center as zero point
-    sat_pos_translate = np.zeros(3)
-    sat_pos_translate[0] = coords[0] - moon_pos_satref[0]
-    sat_pos_translate[1] = coords[1] - moon_pos_satref[1]
-    sat_pos_translate[2] = coords[2] - moon_pos_satref[2]
-    return spice.mxv(rotation, sat_pos_translate)
+    # `rotations` can be given if the source-to-target matrices are already known
+    if len(ets) == 0:
+        return np.empty((0, 3))
+    if rotations is None:
+        rotations = _pxforms(source_frame, target_frame, ets)
+    if "MOON" in target_frame:
+        moon_pos_satref, _ = spice.spkpos("MOON", ets, source_frame, "NONE", "EARTH")
+        # set moon center as zero point
+        coords = coords - moon_pos_satref
+    return np.einsum("nij,nj->ni", rotations, coords)
 
 
 def to_rectangular_multiple(
@@ -131,26 +202,18 @@ def to_rectangular_multiple(
         Target reference frame output will be on.
     Returns
     -------
-    pos: list of list of float
-        Each inner list has 3 values: The rectangular coordinates in kilometers.
+    pos: np.ndarray of float
+        Array of shape (N, 3). Each row has the rectangular coordinates in kilometers.
     """
     _, radios = spice.bodvrd(body, "RADII", 3)
     eq_rad = radios[0]  # Equatorial Radius
     pol_rad = radios[2]  # Polar radius
     flattening = (eq_rad - pol_rad) / eq_rad
-    poss_iaus = []
-    for llh, et in zip(latlonheights, ets):
-        pos_iau = spice.pgrrec(
-            body,
-            spice.rpd() * llh[1],
-            spice.rpd() * llh[0],
-            llh[2],
-            eq_rad,
-            flattening,
-        )
-        poss_iaus.append(_change_frames(pos_iau, source_frame, target_frame, et))
-    poss_iaus = list(poss_iaus)
-    return poss_iaus
+    llhs = np.asarray(latlonheights, dtype=np.float64).reshape(-1, 3)
+    lats_rad = np.radians(llhs[:, 0])
+    lons_rad = np.radians(llhs[:, 1])
+    poss_iaus = _pgrrec_np(body, lons_rad, lats_rad, llhs[:, 2], eq_rad, flattening)
+    return _change_frames(poss_iaus, source_frame, target_frame, ets)
 
 
 def to_planetographic_multiple(
@@ -182,37 +245,35 @@ def to_planetographic_multiple(
         - lon: Longitude in decimal degrees
         - hhh: Height (distance to surface) in kilometers
     """
-    _, radii = spice.bodvrd(body, "RADII", 3)
-    eq_rad = radii[0]  # Equatorial Radius
-    pol_rad = radii[2]  # Polar radius
-    flattening = (eq_rad - pol_rad) / eq_rad
-    llh_list = []
-    for xyz, et in zip(xyz_list, ets):
-        pos_iau = np.array(list(xyz))
-        pos_iau_proc = _change_frames(pos_iau, source_frame, target_frame, et)
-        llh = spice.recpgr(body, pos_iau_proc, eq_rad, flattening)
-        llh_list.append(llh)
-    for i, llh in enumerate(llh_list):
-        lat = llh[1] * spice.dpr()
-        lon = llh[0] * spice.dpr()
-        alt = llh[2]
-        while lon < -180:
-            lon += 360
-        while lon > 180:
-            lon -= 360
-        llh_list[i] = (lat, lon, alt)
-    return llh_list
+    xyzs = np.asarray(xyz_list, dtype=np.float64).reshape(-1, 3)
+    poss_iaus_proc = _change_frames(xyzs, source_frame, target_frame, ets)
+    return _to_planetographic_degrees(poss_iaus_proc, body).tolist()
+
+
+def _wrap_longitude(lon, limit_lon=180):
+    # Values inside [-limit_lon, limit_lon] are returned unchanged
+    lon = np.asarray(lon, dtype=np.float64)
+    period = limit_lon * 2
+    lon = np.where(
+        lon > limit_lon,
+        lon - period * np.ceil((lon - limit_lon) / period),
+        np.where(
+            lon < -limit_lon, lon - period * np.floor((lon + limit_lon) / period), lon
+        ),
+    )
+    return lon if lon.ndim else float(lon)
 
 
 def limit_planetographic(lat, lon, limit_lat=90, limit_lon=180):
-    if lat > limit_lat:
-        lat = limit_lat + (limit_lat - lat)
-        lon -= limit_lon
-    elif lat < -limit_lat:
-        lat = -limit_lat - (limit_lat + lat)
-        lon += limit_lon
-    while lon > limit_lon:
-        lon -= limit_lon * 2
-    while lon < -limit_lon:
-        lon += limit_lon * 2
-    return lat, lon
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    over = lat > limit_lat
+    under = lat < -limit_lat
+    lat = np.where(
+        over,
+        limit_lat + (limit_lat - lat),
+        np.where(under, -limit_lat - (limit_lat + lat), lat),
+    )
+    lon = np.where(over, lon - limit_lon, np.where(under, lon + limit_lon, lon))
+    lon = _wrap_longitude(lon, limit_lon)
+    return (lat if lat.ndim else float(lat)), lon
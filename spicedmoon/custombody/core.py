@@ -5,12 +5,12 @@ This module implements the internal computational engine used by the
 public-facing functions.
 """
 import os
-from typing import List
+from typing import List, Union
 
 import numpy as np
 import spiceypy as spice
 
-from ..angular import get_zn_az, get_phase_sign
+from ..angular import get_phase_sign, _get_bf2tp, _get_zn_azs_bf2tps
 from ..constants import (
     CUSTOM_KERNEL_NAME,
     DEFAULT_OBSERVER_FRAME,
@@ -19,14 +19,21 @@ from ..constants import (
     BASIC_KERNELS,
     MOON_KERNELS,
 )
-from ..coordinates import limit_planetographic
-from ..types import MoonData
-from ..basics import get_radii_moon, furnsh_safer
-from ..heliac import get_sun_moon_data
+from ..coordinates import limit_planetographic, _recpgr_np
+from ..types import MoonData, MoonDataBatch
+from ..basics import (
+    get_radii_moon,
+    SpiceKernelContext,
+    _run_in_processes,
+    _split_batches,
+    _str2ets,
+    _unload,
+)
+from ..heliac import _get_sun_moon_arrays
 
 
-def get_moon_data_body_ellipsoid(
-    utc_time: str,
+def get_moon_datas_body_ellipsoid(
+    utc_times: List[str],
     observer_name: str = DEFAULT_OBSERVER_NAME,
     observer_frame: str = DEFAULT_OBSERVER_FRAME,
     observer_zenith_name: str = DEFAULT_OBSERVER_ZENITH_NAME,
@@ -34,9 +41,11 @@ def get_moon_data_body_ellipsoid(
     latitude: float = None,
     longitude: float = None,
     ignore_bodvrd: bool = True,
-) -> MoonData:
+    vectorized: bool = False,
+) -> Union[List[MoonData], MoonDataBatch]:
     """
-    Calculation of the moon data for the loaded defined observer body, using ellipsoidal geometries.
+    Calculation of the moon data for the loaded defined observer body, using ellipsoidal geometries,
+    for multiple timestamps at once.
     - Uses high-level SPICE geometry (subpnt, recpgr, phaseq).
     - Assumes an ellipsoidal Moon.
     - Observer is a named SPICE body.
@@ -44,8 +53,8 @@ def get_moon_data_body_ellipsoid(
 
     Parameters
     ----------
-    utc_time : str
-        Time at which the lunar data will be calculated, in a valid UTC DateTime format
+    utc_times : list of str
+        Times at which the lunar data will be calculated, in a valid UTC DateTime format
     observer_name : str
         Name of the body of the observer that should be loaded from the extra kernels.
         By default is "Observer", in which case it shouldn't be loaded from the extra
@@ -64,65 +73,159 @@ def get_moon_data_body_ellipsoid(
     ignore_bodvrd : bool
         Ignore the SPICE function bodvrd for the calculation of the Moon's radii and use the values
         1738.1 and 1736
+    vectorized : bool
+        If True, the result is returned as a single `MoonDataBatch`, with one array per
+        quantity, instead of a list of `MoonData`. False by default.
     Returns
     -------
-    MoonData
+    list of MoonData | MoonDataBatch
         Moon data obtained from SPICE toolbox
     """
-    et_date = spice.str2et(utc_time)
+    if len(utc_times) == 0:
+        return MoonDataBatch.empty() if vectorized else []
+    ets = _str2ets(utc_times)
 
     m_eq_rad, m_pol_rad = get_radii_moon(ignore_bodvrd)
     flattening = (m_eq_rad - m_pol_rad) / m_eq_rad
 
     # Calculate moon zenith and azimuth
-    state_zenith, _ = spice.spkezr(
-        "MOON", et_date, observer_frame, "NONE", observer_zenith_name
-    )
-    rectan_zenith = np.split(state_zenith, 2)[0]
-    zenith, azimuth = get_zn_az(
-        rectan_zenith, in_sez=in_sez, latitude=latitude, longitude=longitude
+    states_zenith, _ = spice.spkezr(
+        "MOON", ets, observer_frame, "NONE", observer_zenith_name
     )
+    rectans_zenith = states_zenith[:, :3]
+    # The observer location is the same for all timestamps
+    bf2tp = None if in_sez else _get_bf2tp(latitude, longitude)
+    zns, azs = _get_zn_azs_bf2tps(rectans_zenith, bf2tp)
 
     # Calculate moon phase angle
-    spoint, _, _ = spice.subpnt(
-        "INTERCEPT/ELLIPSOID", "MOON", et_date, "MOON_ME", "NONE", observer_name
+    spoints = [
+        spice.subpnt(
+            "INTERCEPT/ELLIPSOID", "MOON", et, "MOON_ME", "NONE", observer_name
+        )[0]
+        for et in ets
+    ]
+    phases = np.array(
+        [spice.phaseq(et, "MOON", "SUN", observer_name, "NONE") for et in ets]
     )
-    phase = spice.phaseq(et_date, "MOON", "SUN", observer_name, "NONE")
-    phase = phase * spice.dpr()
+    phases = np.degrees(phases)
 
     # Calculate selenographic coordinates of the observer
-    lon_obs, lat_obs, _ = spice.recpgr("MOON", spoint, m_eq_rad, flattening)
-    lon_obs = lon_obs * spice.dpr()
-    lat_obs = lat_obs * spice.dpr()
+    lons_obs, lats_obs, _ = _recpgr_np("MOON", spoints, m_eq_rad, flattening)
+    lons_obs = np.degrees(lons_obs)
+    lats_obs = np.degrees(lats_obs)
 
     # Calculate the distance between observer and moon (KM)
-    state, _ = spice.spkezr("MOON", et_date, "MOON_ME", "NONE", observer_name)
-    dist_obs_moon = np.sqrt(state[0] ** 2 + state[1] ** 2 + state[2] ** 2)
-
-    smd = get_sun_moon_data(utc_time, ignore_bodvrd)
-    lon_sun_rad = smd.lon_sun_rad
-    lat_sun_rad = smd.lat_sun_rad
-    dist_sun_moon_km = smd.dist_sun_moon_km
-    dist_sun_moon_au = smd.dist_sun_moon_au
-
-    lat_obs, lon_obs = limit_planetographic(lat_obs, lon_obs, 90, 180)
-
-    s = get_phase_sign(lon_sun_rad, lon_obs * spice.rpd())
-    phase = s * phase
-
-    moon_data = MoonData(
-        dist_sun_moon_au,
-        dist_sun_moon_km,
-        dist_obs_moon,
-        lon_sun_rad,
-        lat_sun_rad,
-        lat_obs,
-        lon_obs,
-        phase,
-        azimuth,
-        zenith,
+    states, _ = spice.spkezr("MOON", ets, "MOON_ME", "NONE", observer_name)
+    dists_obs_moon = np.linalg.norm(states[:, :3], axis=1)
+
+    (
+        lons_sun_rad,
+        lats_sun_rad,
+        dists_sun_moon_km,
+        dists_sun_moon_au,
+    ) = _get_sun_moon_arrays(ets, ignore_bodvrd)
+
+    lats_obs, lons_obs = limit_planetographic(lats_obs, lons_obs, 90, 180)
+
+    signs = get_phase_sign(lons_sun_rad, np.radians(lons_obs))
+    moon_datas = MoonDataBatch(
+        dists_sun_moon_au,
+        dists_sun_moon_km,
+        dists_obs_moon,
+        lons_sun_rad,
+        lats_sun_rad,
+        lats_obs,
+        lons_obs,
+        signs * phases,
+        azs,
+        zns,
+    )
+    return moon_datas if vectorized else moon_datas.to_list()
+
+
+def get_moon_data_body_ellipsoid(
+    utc_time: str,
+    observer_name: str = DEFAULT_OBSERVER_NAME,
+    observer_frame: str = DEFAULT_OBSERVER_FRAME,
+    observer_zenith_name: str = DEFAULT_OBSERVER_ZENITH_NAME,
+    in_sez: bool = True,
+    latitude: float = None,
+    longitude: float = None,
+    ignore_bodvrd: bool = True,
+) -> MoonData:
+    """
+    Calculation of the moon data for the loaded defined observer body, using ellipsoidal geometries.
+    - Uses high-level SPICE geometry (subpnt, recpgr, phaseq).
+    - Assumes an ellipsoidal Moon.
+    - Observer is a named SPICE body.
+    - Computes azimuth, zenith, sub-observer selenographic coords, distances, signed phase.
+
+    Parameters
+    ----------
+    utc_time : str
+        Time at which the lunar data will be calculated, in a valid UTC DateTime format
+    observer_name : str
+        Name of the body of the observer that should be loaded from the extra kernels.
+        By default is "Observer", in which case it shouldn't be loaded from the extra
+        kernels but from the custom kernel.
+    observer_frame : str
+        Observer frame that will be used in the calculations of the azimuth and zenith.
+    observer_zenith_name : str
+        The observer used for the zenith and azimuth calculation. By default it's "EARTH".
+    in_sez : bool
+        In case that it's calculated without using the extra kernels, the coordinates won't
+        be on SEZ by default and should be corrected rotating them into the correct location.
+    latitude : float
+        Geographic latitude of the observer point. Used if `in_sez` is True.
+    longitude : float
+        Geographic longitude of the observer point. Used if `in_sez` is True.
+    ignore_bodvrd : bool
+        Ignore the SPICE function bodvrd for the calculation of the Moon's radii and use the values
+        1738.1 and 1736
+    Returns
+    -------
+    MoonData
+        Moon data obtained from SPICE toolbox
+    """
+    return get_moon_datas_body_ellipsoid(
+        [utc_time],
+        observer_name,
+        observer_frame,
+        observer_zenith_name,
+        in_sez,
+        latitude,
+        longitude,
+        ignore_bodvrd,
+    )[0]
+
+
+def _get_moon_datas_body_ellipsoid_id(
+    utc_times: List[str],
+    observer_id: int,
+    observer_frame: str,
+    in_sez: bool,
+    latitude: float,
+    longitude: float,
+    earth_as_zenith_observer: bool,
+    ignore_bodvrd: bool,
+) -> MoonDataBatch:
+    observer_name = DEFAULT_OBSERVER_NAME
+    spice.boddef(observer_name, observer_id)
+    if earth_as_zenith_observer:
+        zenith_observer = "EARTH"
+    else:
+        zenith_observer = observer_name
+    return get_moon_datas_body_ellipsoid(
+        utc_times,
+        observer_name,
+        observer_frame,
+        zenith_observer,
+        in_sez,
+        latitude,
+        longitude,
+        ignore_bodvrd,
+        True,
     )
-    return moon_data
 
 
 def get_moon_datas_body_ellipsoid_id(
@@ -136,7 +239,9 @@ def get_moon_datas_body_ellipsoid_id(
     longitude: float = None,
     earth_as_zenith_observer: bool = False,
     ignore_bodvrd: bool = True,
-) -> List[MoonData]:
+    num_workers: int = 1,
+    vectorized: bool = False,
+) -> Union[List[MoonData], MoonDataBatch]:
     """
     Calculation of the moon data for a observer body defined in a custom kernel file, using ellipsoidal geometries.
     - Uses high-level SPICE geometry (subpnt, recpgr, phaseq).
@@ -172,39 +277,45 @@ def get_moon_datas_body_ellipsoid_id(
     ignore_bodvrd : bool
         Ignore the SPICE function bodvrd for the calculation of the Moon's radii and use the values
         1738.1 and 1736
+    num_workers : int
+        Number of worker processes the timestamps are split among. Each worker loads its
+        own copy of the SPICE kernels. By default 1, which computes everything in the
+        current process.
+    vectorized : bool
+        If True, the result is returned as a single `MoonDataBatch`, with one array per
+        quantity, instead of a list of `MoonData`. False by default.
     Returns
     -------
-    list of MoonData
+    list of MoonData | MoonDataBatch
         Moon data obtained from SPICE toolbox
     """
     kernels = BASIC_KERNELS + MOON_KERNELS
-
-    for kernel in kernels:
-        k_path = os.path.join(kernels_path, kernel)
-        furnsh_safer(k_path)
+    k_paths = [os.path.join(kernels_path, kernel) for kernel in kernels]
     custom_kernel_path = os.path.join(custom_kernel_dir, CUSTOM_KERNEL_NAME)
-    furnsh_safer(custom_kernel_path)
-
-    observer_name = DEFAULT_OBSERVER_NAME
-    spice.boddef(observer_name, observer_id)
-    if earth_as_zenith_observer:
-        zenith_observer = "EARTH"
-    else:
-        zenith_observer = observer_name
-    moon_datas = []
-    for utc_time in utc_times:
-        new_md = get_moon_data_body_ellipsoid(
-            utc_time,
-            observer_name,
-            observer_frame,
-            zenith_observer,
-            in_sez,
-            latitude,
-            longitude,
-            ignore_bodvrd,
+    k_paths.append(custom_kernel_path)
+    args = (
+        observer_id,
+        observer_frame,
+        in_sez,
+        latitude,
+        longitude,
+        earth_as_zenith_observer,
+        ignore_bodvrd,
+    )
+    if num_workers > 1:
+        batches_args = [
+            (utc_times[b], *args) for b in _split_batches(len(utc_times), num_workers)
+        ]
+        moon_datas = MoonDataBatch.concatenate(
+            _run_in_processes(
+                _get_moon_datas_body_ellipsoid_id, k_paths, batches_args, num_workers
+            )
         )
-        moon_datas.append(new_md)
-
-    spice.kclear()
-
-    return moon_datas
+    else:
+        with SpiceKernelContext(k_paths):
+            try:
+                moon_datas = _get_moon_datas_body_ellipsoid_id(utc_times, *args)
+            finally:
+                # The custom kernel is rewritten on every call, so it can't outlive it
+                _unload(custom_kernel_path)
+    return moon_datas if vectorized else moon_datas.to_list()
@@ -2,12 +2,14 @@
 Create and remove the custom kernel used in some `spicedmoon.custombody` calculations.
 """
 import os
-from typing import List
+from typing import List, Tuple
 
 import numpy as np
 import spiceypy as spice
 
+from ..basics import _str2ets
 from ..constants import CUSTOM_KERNEL_NAME
+from ..coordinates import _pxforms
 
 
 def _calculate_ets(
@@ -23,36 +25,37 @@ def _calculate_ets(
     polynomial_degree: int
         Degree of the lagrange polynomials that will be used to interpolate the states.
     """
+    if len(utc_times) == 0:
+        return np.array([])
     min_states_polynomial = polynomial_degree + 1
     # Min # states that are required to define a polynomial of that degree
-    ets = np.array([])
     left_states = int(min_states_polynomial / 2)
     right_states = left_states + min_states_polynomial % 2
-    for utc_time in utc_times:
-        et0 = spice.str2et(utc_time)
-        etprev = et0 - delta_t * left_states
-        etf = et0 + delta_t * right_states
-        ets_t = np.arange(etprev, etf, delta_t)
-        for et_t in ets_t:
-            if et_t not in ets:
-                index = np.searchsorted(ets, et_t)
-                ets = np.insert(ets, index, et_t)
-    return ets
+    # One row of states around each timestamp, from et0 - left to et0 + right
+    starts = _str2ets(utc_times) - delta_t * left_states
+    offsets = np.arange(left_states + right_states, dtype=np.float64) * delta_t
+    # Sorted and without repeated ets, as the overlapping segments share some
+    return np.unique((starts[:, None] + offsets[None, :]).ravel())
 
 
 def _calculate_states(
     ets: np.ndarray,
     pos_iau: np.ndarray,
-    delta_t: float,
     source_frame: str,
     target_frame: str,
-) -> np.ndarray:
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Returns a ndarray containing the states of a point referencing the target frame.
+    Returns the positions and velocities of a point referencing the target frame.
+
+    Both are time-ordered arrays of shape (N, 3): positions (x, y, z) in kilometers and
+    velocities (dx/dt, dy/dt, dz/dt) in kilometers per second, of body relative to center,
+    specified relative to frame. Concatenated along the second axis they form the states
+    needed by spice function "spkw09_c", for example.
 
-    The states array is a time-ordered array of geometric states (x, y, z, dx/dt, dy/dt, dz/dt,
-    in kilometers and kilometers per second) of body relative to center, specified relative
-    to frame. Useful for spice function "spkw09_c", for example.
+    Velocities are finite differences of the positions (`np.gradient`): first-order
+    one-sided at the first and last ets, and second-order central with non-uniform
+    spacing elsewhere, including across the gaps between the groups of states of
+    different timestamps, where they mix the neighbouring groups.
 
     Parameters
     ----------
@@ -60,8 +63,6 @@ def _calculate_states(
         Array of TDB seconds from J2000 (et dates) of which the data will be taken
     pos_iau : np.ndarray
         Rectangular coordinates of the point, referencing IAU frame.
-    delta_t : float
-        TDB seconds between states
     source_frame : str
         Name of the frame to transform from.
     target_frame : str
@@ -69,27 +70,15 @@ def _calculate_states(
 
     Returns
     -------
-    ndarray of float
-        ndarray containing the states calculated
+    positions : np.ndarray of float
+        Positions calculated, with shape (N, 3).
+    velocities : np.ndarray of float
+        Velocities calculated, with shape (N, 3).
     """
-    num_coordinates = 3
-    n_state_attributes = 6
-    states = np.zeros((len(ets), n_state_attributes))
-    for i, et_value in enumerate(ets):
-        states[i, :num_coordinates] = np.dot(
-            spice.pxform(source_frame, target_frame, et_value), pos_iau
-        )
-
-    for i in range(len(ets) - 1):
-        states[i, num_coordinates:] = (
-            states[i + 1, :num_coordinates] - states[i, :num_coordinates]
-        ) / delta_t
-
-    pos_np1 = np.dot(
-        spice.pxform(source_frame, target_frame, ets[-1] + delta_t), pos_iau
-    )
-    states[-1, num_coordinates:] = (pos_np1 - states[-1, :num_coordinates]) / delta_t
-    return states
+    rotations = _pxforms(source_frame, target_frame, ets)
+    positions = np.einsum("nij,j->ni", rotations, pos_iau)
+    velocities = np.gradient(positions, ets, axis=0)
+    return positions, velocities
 
 
 class Location:
@@ -104,11 +93,16 @@ class Location:
         Degree of the lagrange polynomials that used to interpolate the states.
     ets: np.ndarray of float64
         Array of TDB seconds from J2000 (et dates) of which the data will be taken.
+    positions : np.ndarray of float64
+        Array of positions of body relative to center, with shape (N, 3).
+    velocities : np.ndarray of float64
+        Array of velocities of body relative to center, with shape (N, 3).
     states : np.ndarray of float64
-        Array of geometric states of body relative to center
+        Array of geometric states of body relative to center, with shape (N, 6).
+        Built from `positions` and `velocities` on access.
     """
 
-    __slots__ = ["point_id", "polynomial_degree", "ets", "states"]
+    __slots__ = ["point_id", "polynomial_degree", "ets", "positions", "velocities"]
 
     def __init__(
         self,
@@ -159,10 +153,14 @@ class Location:
         pos_iau = spice.pgrrec(
             body, np.radians(lon), np.radians(lat), alt_km, eq_rad, flattening
         )
-        self.states = _calculate_states(
-            self.ets, pos_iau, delta_t, source_frame, target_frame
+        self.positions, self.velocities = _calculate_states(
+            self.ets, pos_iau, source_frame, target_frame
         )
 
+    @property
+    def states(self) -> np.ndarray:
+        return np.concatenate([self.positions, self.velocities], axis=1)
+
 
 def create_custom_point_kernel(
     obs: Location,
@@ -195,8 +193,8 @@ def create_custom_point_kernel(
         "0",
         obs.polynomial_degree,
         len(obs.ets),
-        obs.states.tolist(),
-        obs.ets.tolist(),
+        np.ascontiguousarray(obs.states, dtype=np.float64),
+        np.ascontiguousarray(obs.ets, dtype=np.float64),
     )
     spice.spkcls(handle)
 
@@ -2,13 +2,11 @@
 Calculate lunar geometries for an earth-based new point.
 """
 import os
-from typing import List, Union
+from typing import List, Tuple, Union
 from datetime import datetime
 
-import spiceypy as spice
-
-from ..types import MoonData
-from ..basics import furnsh_safer, dt_to_str
+from ..types import MoonData, MoonDataBatch
+from ..basics import SpiceKernelContext, dt_to_str
 from .core import get_moon_datas_body_ellipsoid_id
 from ..constants import BASIC_KERNELS, MOON_KERNELS
 from .customkernel import (
@@ -32,8 +30,12 @@ class _EarthLocation(Location):
         Degree of the lagrange polynomials that used to interpolate the states.
     ets: np.ndarray of float64
         Array of TDB seconds from J2000 (et dates) of which the data will be taken.
+    positions : np.ndarray of float64
+        Array of positions of body relative to center, with shape (N, 3).
+    velocities : np.ndarray of float64
+        Array of velocities of body relative to center, with shape (N, 3).
     states : np.ndarray of float64
-        Array of geometric states of body relative to center
+        Array of geometric states of body relative to center, with shape (N, 6).
     """
 
     def __init__(
@@ -116,16 +118,14 @@ def _create_earth_point_kernel(
     """
     kernels = BASIC_KERNELS
     if "MOON" in source_frame or "MOON" in target_frame:
-        kernels += MOON_KERNELS
-    for kernel in kernels:
-        k_path = os.path.join(kernels_path, kernel)
-        furnsh_safer(k_path)
-    obs = _EarthLocation(
-        id_code, utc_times, lat, lon, altitude, source_frame, target_frame
-    )
-    center = EARTH_ID_CODE
-    create_custom_point_kernel(obs, center, custom_kernel_dir, target_frame)
-    spice.kclear()
+        kernels = kernels + MOON_KERNELS
+    k_paths = [os.path.join(kernels_path, kernel) for kernel in kernels]
+    with SpiceKernelContext(k_paths):
+        obs = _EarthLocation(
+            id_code, utc_times, lat, lon, altitude, source_frame, target_frame
+        )
+        center = EARTH_ID_CODE
+        create_custom_point_kernel(obs, center, custom_kernel_dir, target_frame)
 
 
 def get_moon_datas(
@@ -141,7 +141,9 @@ def get_moon_datas(
     ignore_bodvrd: bool = True,
     source_frame: str = "ITRF93",
     target_frame: str = "ITRF93",
-) -> List[MoonData]:
+    num_workers: int = 1,
+    vectorized: bool = False,
+) -> Union[List[MoonData], MoonDataBatch]:
     """Calculation of needed Moon data from SPICE toolbox
 
     Moon phase angle, selenographic coordinates and distance from observer point to moon.
@@ -181,9 +183,16 @@ def get_moon_datas(
         Name of the frame to transform the coordinates from.
     target_frame : str
         Name of the frame which the location point will be referencing.
+    num_workers : int
+        Number of worker processes the timestamps are split among. Each worker loads its
+        own copy of the SPICE kernels. By default 1, which computes everything in the
+        current process.
+    vectorized : bool
+        If True, the result is returned as a single `MoonDataBatch`, with one array per
+        quantity, instead of a list of `MoonData`. False by default.
     Returns
     -------
-    list of MoonData
+    list of MoonData | MoonDataBatch
         Moon data obtained from SPICE toolbox
     """
     if custom_kernel_path == None:
@@ -191,7 +200,7 @@ def get_moon_datas(
     id_code = EARTH_ID_CODE * 1000 + 100
     utc_times = dt_to_str(times)
     if len(utc_times) == 0:
-        return []
+        return MoonDataBatch.empty() if vectorized else []
     remove_custom_kernel_file(custom_kernel_path)
     _create_earth_point_kernel(
         utc_times,
@@ -215,4 +224,84 @@ def get_moon_datas(
         lon,
         earth_as_zenith_observer,
         ignore_bodvrd,
+        num_workers,
+        vectorized,
     )
+
+
+def get_moon_datas_bulk(
+    locations: List[Tuple[float, float, float, Union[List[str], List[datetime]]]],
+    kernels_path: str,
+    correct_zenith_azimuth: bool = True,
+    observer_frame: str = "ITRF93",
+    earth_as_zenith_observer: bool = False,
+    custom_kernel_path: str = None,
+    ignore_bodvrd: bool = True,
+    source_frame: str = "ITRF93",
+    target_frame: str = "ITRF93",
+    vectorized: bool = False,
+) -> List[Union[List[MoonData], MoonDataBatch]]:
+    """Calculation of needed Moon data for several earth-based locations
+
+    Same as calling `get_moon_datas` once per location, but the SPICE kernels are only
+    loaded once and cleared once for all of them. The custom kernel is still written
+    again for each location.
+
+    Parameters
+    ----------
+    locations : list of tuple
+        Each tuple has 4 values:
+        - lat: Geographic latitude (in degrees) of the location.
+        - lon: Geographic longitude (in degrees) of the location.
+        - altitude: Altitude over the sea level in meters.
+        - times: Times at which the lunar data will be calculated, as list of str or
+            list of datetime. Same format as in `get_moon_datas`.
+    kernels_path : str
+        Path where the SPICE kernels are stored
+    correct_zenith_azimuth : bool
+        In case that it's calculated without using the extra kernels, the coordinates should be
+        corrected rotating them into the correct location.
+    observer_frame : str
+        Observer frame that will be used in the calculations of the azimuth and zenith.
+    earth_as_zenith_observer : bool
+        If True the Earth will be used as the observer for the zenith and azimuth calculation.
+        Otherwise it will be the actual observer. By default is False.
+    custom_kernel_path: str
+        Path of the kernel custom.bsp that will be edited by the library, not only read.
+        If none, it will be the same as kernels_path.
+    ignore_bodvrd : bool
+        Ignore the SPICE function bodvrd for the calculation of the Moon's radii and use the values
+        1738.1 and 1736
+    source_frame : str
+        Name of the frame to transform the coordinates from.
+    target_frame : str
+        Name of the frame which the location point will be referencing.
+    vectorized : bool
+        If True, the result of each location is a single `MoonDataBatch`, with one array per
+        quantity, instead of a list of `MoonData`. False by default.
+    Returns
+    -------
+    list of (list of MoonData | MoonDataBatch)
+        Moon data obtained from SPICE toolbox, in the same order as `locations`.
+    """
+    kernels = BASIC_KERNELS + MOON_KERNELS
+    k_paths = [os.path.join(kernels_path, kernel) for kernel in kernels]
+    with SpiceKernelContext(k_paths):
+        return [
+            get_moon_datas(
+                lat,
+                lon,
+                altitude,
+                times,
+                kernels_path,
+                correct_zenith_azimuth,
+                observer_frame,
+                earth_as_zenith_observer,
+                custom_kernel_path,
+                ignore_bodvrd,
+                source_frame,
+                target_frame,
+                vectorized=vectorized,
+            )
+            for lat, lon, altitude, times in locations
+        ]
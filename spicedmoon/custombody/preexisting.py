@@ -3,14 +3,17 @@ Calculate lunar geometries for a  point already existing in an extra custom kern
 """
 import os
 from datetime import datetime
-from typing import List, Union
+from typing import List, Tuple, Union
 
-import spiceypy as spice
-
-from ..basics import dt_to_str, furnsh_safer
-from ..custombody.core import get_moon_data_body_ellipsoid
+from ..basics import (
+    dt_to_str,
+    SpiceKernelContext,
+    _run_in_processes,
+    _split_batches,
+)
+from ..custombody.core import get_moon_datas_body_ellipsoid
 from ..constants import BASIC_KERNELS, MOON_KERNELS
-from ..types import MoonData
+from ..types import MoonData, MoonDataBatch
 
 
 def get_moon_datas_from_extra_kernels(
@@ -22,7 +25,9 @@ def get_moon_datas_from_extra_kernels(
     observer_frame: str,
     earth_as_zenith_observer: bool = False,
     ignore_bodvrd: bool = True,
-) -> List[MoonData]:
+    num_workers: int = 1,
+    vectorized: bool = False,
+) -> Union[List[MoonData], MoonDataBatch]:
     """Calculation of needed Moon data from SPICE toolbox
 
     Moon phase angle, selenographic coordinates and distance from observer point to moon.
@@ -52,34 +57,105 @@ def get_moon_datas_from_extra_kernels(
     ignore_bodvrd : bool
         Ignore the SPICE function bodvrd for the calculation of the Moon's radii and use the values
         1738.1 and 1736
+    num_workers : int
+        Number of worker processes the timestamps are split among. Each worker loads its
+        own copy of the SPICE kernels. By default 1, which computes everything in the
+        current process.
+    vectorized : bool
+        If True, the result is returned as a single `MoonDataBatch`, with one array per
+        quantity, instead of a list of `MoonData`. False by default.
     Returns
     -------
-    list of MoonData
+    list of MoonData | MoonDataBatch
         Moon data obtained from SPICE toolbox
     """
     base_kernels = BASIC_KERNELS + MOON_KERNELS
-    for kernel in base_kernels:
-        k_path = os.path.join(kernels_path, kernel)
-        furnsh_safer(k_path)
-    for kernel in extra_kernels:
-        k_path = os.path.join(extra_kernels_path, kernel)
-        furnsh_safer(k_path)
+    k_paths = [os.path.join(kernels_path, kernel) for kernel in base_kernels]
+    k_paths += [os.path.join(extra_kernels_path, kernel) for kernel in extra_kernels]
 
     if earth_as_zenith_observer:
         zenith_observer = "EARTH"
     else:
         zenith_observer = observer_name
-    moon_datas = []
     utc_times = dt_to_str(times)
-    for utc_time in utc_times:
-        moon_datas.append(
-            get_moon_data_body_ellipsoid(
-                utc_time,
+    args = (observer_name, observer_frame, zenith_observer, True, None, None)
+    if num_workers > 1:
+        batches_args = [
+            (utc_times[b], *args, ignore_bodvrd, True)
+            for b in _split_batches(len(utc_times), num_workers)
+        ]
+        moon_datas = MoonDataBatch.concatenate(
+            _run_in_processes(
+                get_moon_datas_body_ellipsoid, k_paths, batches_args, num_workers
+            )
+        )
+    else:
+        with SpiceKernelContext(k_paths):
+            moon_datas = get_moon_datas_body_ellipsoid(
+                utc_times, *args, ignore_bodvrd, True
+            )
+    return moon_datas if vectorized else moon_datas.to_list()
+
+
+def get_moon_datas_from_extra_kernels_bulk(
+    requests: List[Tuple[str, str, Union[List[str], List[datetime]]]],
+    kernels_path: str,
+    extra_kernels: List[str],
+    extra_kernels_path: str,
+    earth_as_zenith_observer: bool = False,
+    ignore_bodvrd: bool = True,
+    vectorized: bool = False,
+) -> List[Union[List[MoonData], MoonDataBatch]]:
+    """Calculation of needed Moon data for several observers of the same extra kernels
+
+    Same as calling `get_moon_datas_from_extra_kernels` once per observer, but the
+    kernels are only loaded once and cleared once for all of them.
+
+    Parameters
+    ----------
+    requests : list of tuple
+        Each tuple has 3 values:
+        - observer_name: Name of the body of the observer that will be loaded from the
+            extra kernels.
+        - observer_frame: Observer frame that will be used in the calculations of the
+            azimuth and zenith.
+        - times: Times at which the lunar data will be calculated, as list of str or
+            list of datetime. Same format as in `get_moon_datas_from_extra_kernels`.
+    kernels_path : str
+        Path where the SPICE kernels are stored
+    extra_kernels : list of str
+        Custom kernels from which the observer bodies will be loaded.
+    extra_kernels_path : str
+        Folder where the extra kernels are located.
+    earth_as_zenith_observer : bool
+        If True the Earth will be used as the observer for the zenith and azimuth calculation.
+        Otherwise it will be the actual observer. By default is False.
+    ignore_bodvrd : bool
+        Ignore the SPICE function bodvrd for the calculation of the Moon's radii and use the values
+        1738.1 and 1736
+    vectorized : bool
+        If True, the result of each observer is a single `MoonDataBatch`, with one array per
+        quantity, instead of a list of `MoonData`. False by default.
+    Returns
+    -------
+    list of (list of MoonData | MoonDataBatch)
+        Moon data obtained from SPICE toolbox, in the same order as `requests`.
+    """
+    base_kernels = BASIC_KERNELS + MOON_KERNELS
+    k_paths = [os.path.join(kernels_path, kernel) for kernel in base_kernels]
+    k_paths += [os.path.join(extra_kernels_path, kernel) for kernel in extra_kernels]
+    with SpiceKernelContext(k_paths):
+        return [
+            get_moon_datas_from_extra_kernels(
+                times,
+                kernels_path,
+                extra_kernels,
+                extra_kernels_path,
                 observer_name,
                 observer_frame,
-                zenith_observer,
-                ignore_bodvrd=ignore_bodvrd,
+                earth_as_zenith_observer,
+                ignore_bodvrd,
+                vectorized=vectorized,
             )
-        )
-    spice.kclear()
-    return moon_datas
+            for observer_name, observer_frame, times in requests
+        ]
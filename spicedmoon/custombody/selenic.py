@@ -5,16 +5,14 @@ import os
 from typing import List, Union
 from datetime import datetime
 
-import spiceypy as spice
-
 from ..basics import (
-    furnsh_safer,
+    SpiceKernelContext,
     dt_to_str,
     get_radii_moon,
 )
 from .core import get_moon_datas_body_ellipsoid_id
 from ..constants import MOON_ID_CODE, BASIC_KERNELS, MOON_KERNELS
-from ..types import MoonData
+from ..types import MoonData, MoonDataBatch
 from .customkernel import (
     Location,
     create_custom_point_kernel,
@@ -34,8 +32,12 @@ class _MoonLocation(Location):
         Degree of the lagrange polynomials that used to interpolate the states.
     ets: np.ndarray of float64
         Array of TDB seconds from J2000 (et dates) of which the data will be taken.
+    positions : np.ndarray of float64
+        Array of positions of body relative to center, with shape (N, 3).
+    velocities : np.ndarray of float64
+        Array of velocities of body relative to center, with shape (N, 3).
     states : np.ndarray of float64
-        Array of geometric states of body relative to center
+        Array of geometric states of body relative to center, with shape (N, 6).
     """
 
     def __init__(
@@ -126,22 +128,20 @@ def _create_moon_point_kernel(
         Name of the frame which the location point will be referencing.
     """
     kernels = BASIC_KERNELS + MOON_KERNELS
-    for kernel in kernels:
-        k_path = os.path.join(kernels_path, kernel)
-        furnsh_safer(k_path)
-    obs = _MoonLocation(
-        id_code,
-        utc_times,
-        lat,
-        lon,
-        altitude,
-        source_frame,
-        target_frame,
-        ignore_bodvrd,
-    )
-    center = MOON_ID_CODE
-    create_custom_point_kernel(obs, center, custom_kernel_dir, target_frame)
-    spice.kclear()
+    k_paths = [os.path.join(kernels_path, kernel) for kernel in kernels]
+    with SpiceKernelContext(k_paths):
+        obs = _MoonLocation(
+            id_code,
+            utc_times,
+            lat,
+            lon,
+            altitude,
+            source_frame,
+            target_frame,
+            ignore_bodvrd,
+        )
+        center = MOON_ID_CODE
+        create_custom_point_kernel(obs, center, custom_kernel_dir, target_frame)
 
 
 def get_moon_datas_from_moon(
@@ -156,7 +156,9 @@ def get_moon_datas_from_moon(
     ignore_bodvrd: bool = True,
     source_frame: str = "MOON_ME",
     target_frame: str = "MOON_ME",
-) -> List[MoonData]:
+    num_workers: int = 1,
+    vectorized: bool = False,
+) -> Union[List[MoonData], MoonDataBatch]:
     """Calculation of needed Moon data from SPICE toolbox
 
     Moon phase angle, selenographic coordinates and distance from observer point to moon.
@@ -193,9 +195,16 @@ def get_moon_datas_from_moon(
         Name of the frame to transform the coordinates from.
     target_frame : str
         Name of the frame which the location point will be referencing.
+    num_workers : int
+        Number of worker processes the timestamps are split among. Each worker loads its
+        own copy of the SPICE kernels. By default 1, which computes everything in the
+        current process.
+    vectorized : bool
+        If True, the result is returned as a single `MoonDataBatch`, with one array per
+        quantity, instead of a list of `MoonData`. False by default.
     Returns
     -------
-    list of MoonData
+    list of MoonData | MoonDataBatch
         Moon data obtained from SPICE toolbox
     """
     if custom_kernel_path == None:
@@ -203,7 +212,7 @@ def get_moon_datas_from_moon(
     id_code = MOON_ID_CODE * 1000 + 100
     utc_times = dt_to_str(times)
     if len(utc_times) == 0:
-        return []
+        return MoonDataBatch.empty() if vectorized else []
     remove_custom_kernel_file(custom_kernel_path)
     _create_moon_point_kernel(
         utc_times,
@@ -228,4 +237,6 @@ def get_moon_datas_from_moon(
         lon,
         False,
         ignore_bodvrd,
+        num_workers,
+        vectorized,
     )
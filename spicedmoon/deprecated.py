@@ -3,18 +3,46 @@ Implementation of the now deprecated `spicedmoon.spicedmoon` submodule.
 It will be eventually removed, but for now it preserves 1.0.13 functionalities that
 should remain temporarily.
 """
+from importlib import import_module as _import_module
+from typing import TYPE_CHECKING as _TYPE_CHECKING
 from typing import List, Tuple
 import warnings
 
-from .custombody.preexisting import get_moon_datas_from_extra_kernels
-from .geometry import (
-    get_moon_datas_xyzs,
-)
-from .custombody.geotic import get_moon_datas
-from .custombody.selenic import get_moon_datas_from_moon
-from .heliac import get_sun_moon_datas
 from .types import MoonData, MoonSunData
-from .basics import furnsh_safer as _furnsh_safer
+
+# Same lazy loading as the package root, so the SPICE-based submodules are only
+# imported when one of their functions is used.
+_LAZY_ATTRIBUTES = {
+    "get_moon_datas_from_extra_kernels": ".custombody.preexisting",
+    "get_moon_datas_xyzs": ".geometry",
+    "get_moon_datas": ".custombody.geotic",
+    "get_moon_datas_from_moon": ".custombody.selenic",
+    "get_sun_moon_datas": ".heliac",
+}
+
+
+def __getattr__(name):
+    if name == "_furnsh_safer":
+        value = _import_module(".basics", __package__).furnsh_safer
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(_import_module(_LAZY_ATTRIBUTES[name], __package__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+if _TYPE_CHECKING:
+    from .custombody.preexisting import get_moon_datas_from_extra_kernels
+    from .geometry import get_moon_datas_xyzs
+    from .custombody.geotic import get_moon_datas
+    from .custombody.selenic import get_moon_datas_from_moon
+    from .heliac import get_sun_moon_datas
+    from .basics import furnsh_safer as _furnsh_safer
 
 
 warnings.warn(
@@ -36,6 +64,8 @@ def get_moon_datas_xyzs_no_zenith_azimuth(
         FutureWarning,
         stacklevel=2,
     )
+    from .geometry import get_moon_datas_xyzs
+
     return get_moon_datas_xyzs(
         xyzs, dts, kernels_path, source_frame, target_frame, "ITRF93", False
     )
@@ -2,123 +2,116 @@
 Compute main lunar geometries
 """
 import os
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 import numpy as np
 import spiceypy as spice
 
-from .angular import get_zn_az, get_phase_sign
-from .basics import furnsh_safer, get_radii_moon
-from .types import MoonData
-from .constants import BASIC_KERNELS, MOON_KERNELS
+from .angular import get_phase_sign, _get_bf2tps, _get_zn_azs_bf2tps
+from .basics import (
+    dt_to_str,
+    SpiceKernelContext,
+    _run_in_processes,
+    _split_batches,
+    _KM_PER_AU,
+    _str2ets,
+)
+from .types import MoonData, MoonDataBatch
+from .constants import BASIC_KERNELS, MOON_KERNELS, MOON_EQ_RAD, MOON_POL_RAD
 from .coordinates import (
-    to_planetographic_multiple,
     to_rectangular_multiple,
     limit_planetographic,
+    _recpgr_np,
+    _pxforms,
+    _change_frames,
+    _to_planetographic_degrees,
 )
 
+# The direct geometry always uses the spicedmoon lunar radii, never bodvrd's
+_MOON_FLATTENING = (MOON_EQ_RAD - MOON_POL_RAD) / MOON_EQ_RAD
+_MOON_EQ_RAD_SQ = MOON_EQ_RAD**2
+_MOON_POL_RAD_SQ = MOON_POL_RAD**2
+
 
-def _get_sel_lon_lat_intercept(pos_moonref: np.ndarray):
-    m_eq_rad, m_pol_rad = get_radii_moon(ignore_bodvrd=True)
-    flattening = (m_eq_rad - m_pol_rad) / m_eq_rad
-    x, y, z = pos_moonref
+def _get_sel_lon_lat_intercept(poss_moonref: np.ndarray):
+    x, y, z = poss_moonref[:, 0], poss_moonref[:, 1], poss_moonref[:, 2]
     # Intersection ray center-body with the moon ellipsoid
-    k = 1.0 / np.sqrt((x * x + y * y) / (m_eq_rad**2) + (z * z) / (m_pol_rad**2))
-    spoint = np.array([k * x, k * y, k * z])
-    sel_lon, sel_lat, _ = spice.recpgr("MOON", spoint, m_eq_rad, flattening)
-    return sel_lon, sel_lat
+    k = 1.0 / np.sqrt((x * x + y * y) / _MOON_EQ_RAD_SQ + (z * z) / _MOON_POL_RAD_SQ)
+    spoints = poss_moonref * k[:, np.newaxis]
+    sel_lons, sel_lats, _ = _recpgr_np("MOON", spoints, MOON_EQ_RAD, _MOON_FLATTENING)
+    return sel_lons, sel_lats
 
 
-def _get_sel_lon_lat_simple(pos_moonref: np.ndarray):
-    sel_lon = np.arctan2(pos_moonref[1], pos_moonref[0])
-    sel_lat = np.arctan2(
-        pos_moonref[2],
-        np.sqrt(pos_moonref[0] * pos_moonref[0] + pos_moonref[1] * pos_moonref[1]),
+def _get_sel_lon_lat_simple(poss_moonref: np.ndarray):
+    sel_lons = np.arctan2(poss_moonref[:, 1], poss_moonref[:, 0])
+    sel_lats = np.arctan2(
+        poss_moonref[:, 2], np.hypot(poss_moonref[:, 0], poss_moonref[:, 1])
     )
-    return sel_lon, sel_lat
+    return sel_lons, sel_lats
 
 
-def _get_distance_moon(pos_moonref: np.ndarray):
-    distance = np.sqrt(
-        pos_moonref[0] * pos_moonref[0]
-        + pos_moonref[1] * pos_moonref[1]
-        + pos_moonref[2] * pos_moonref[2]
-    )
-    return distance
+def _get_distance_moon(poss_moonref: np.ndarray):
+    return np.linalg.norm(poss_moonref, axis=1)
 
 
-def _get_moon_data_xyzs(
-    xyz: Tuple[float, float, float],
-    et: float,
-    source_frame: str,
-    target_frame: str,
-    angular_frame: str,
+def _compute_geometry(
+    sun_pos_moonref: np.ndarray,
+    sat_pos_moonref: np.ndarray,
     intercept_ellipsoid: bool,
-) -> MoonData:
-    sun_pos_moonref, lightime = spice.spkpos("SUN", et, target_frame, "NONE", "MOON")
-    # sun_pos_satref, lighttime = spice.spkpos("SUN", et, source_frame, "NONE", "EARTH")
-    obs_body = "EARTH"
-    if "MOON" in source_frame and "MOON" in target_frame:
-        obs_body = "MOON"
-    moon_pos_satref, lightime = spice.spkpos("MOON", et, source_frame, "NONE", obs_body)
-    rotation = spice.pxform(source_frame, target_frame, et)
-    # set moon center as zero point
-    sat_pos_translate = np.zeros(3)
-    sat_pos_translate[0] = xyz[0] - moon_pos_satref[0]
-    sat_pos_translate[1] = xyz[1] - moon_pos_satref[1]
-    sat_pos_translate[2] = xyz[2] - moon_pos_satref[2]
-    sat_pos_moonref = spice.mxv(rotation, sat_pos_translate)
+) -> Tuple[np.ndarray, ...]:
+    """Compute the lunar geometry from Moon-centred positions of the Sun and observer.
+
+    Parameters
+    ----------
+    sun_pos_moonref: np.ndarray
+        Array of shape (N, 3) with the Sun positions in the Moon reference frame.
+    sat_pos_moonref: np.ndarray
+        Array of shape (N, 3) with the observer positions in the Moon reference frame.
+    intercept_ellipsoid: bool
+        If True, the selenographic coordinates are computed over the lunar ellipsoid
+        intercept instead of being the spherical ones.
+
+    Returns
+    -------
+    geometry: tuple of np.ndarray
+        Arrays of shape (N,) with the selenographic longitude and latitude of the Sun
+        (radians), the selenographic latitude and longitude of the observer (degrees),
+        the Sun-Moon and observer-Moon distances (km) and the unsigned phase angle
+        (degrees).
+    """
+    # Sun and observer positions go through the same computations in a single pass
+    n_poss = len(sun_pos_moonref)
+    poss_moonref = np.concatenate((sun_pos_moonref, sat_pos_moonref))
     # selenographic coordinates
     if intercept_ellipsoid:
-        sel_lon_sun, sel_lat_sun = _get_sel_lon_lat_intercept(sun_pos_moonref)
-        sel_lon_sat, sel_lat_sat = _get_sel_lon_lat_intercept(sat_pos_moonref)
+        sel_lons, sel_lats = _get_sel_lon_lat_intercept(poss_moonref)
     else:
-        sel_lon_sun, sel_lat_sun = _get_sel_lon_lat_simple(sun_pos_moonref)
-        sel_lon_sat, sel_lat_sat = _get_sel_lon_lat_simple(sat_pos_moonref)
-    sel_lon_sat, sel_lat_sat = np.array([sel_lon_sat, sel_lat_sat]) * 180.0 / np.pi
+        sel_lons, sel_lats = _get_sel_lon_lat_simple(poss_moonref)
+    sel_lon_sun, sel_lat_sun = sel_lons[:n_poss], sel_lats[:n_poss]
+    sel_lon_sat = np.degrees(sel_lons[n_poss:])
+    sel_lat_sat = np.degrees(sel_lats[n_poss:])
     sel_lat_sun, sel_lon_sun = limit_planetographic(
         sel_lat_sun, sel_lon_sun, np.pi / 2, np.pi
     )
     sel_lat_sat, sel_lon_sat = limit_planetographic(sel_lat_sat, sel_lon_sat, 90, 180)
     # distances
-    distance_sun_moon = _get_distance_moon(sun_pos_moonref)
-    dist_sun_moon_au = spice.convrt(distance_sun_moon, "KM", "AU")
-    distance_sat_moon = _get_distance_moon(sat_pos_moonref)
-    # zn az
-    ang_rotation = spice.pxform(source_frame, angular_frame, et)
-    sat_pos_angref = spice.mxv(ang_rotation, sat_pos_translate)
-    plt = to_planetographic_multiple(
-        [xyz],
-        obs_body,
-        [et],
-        source_frame,
-        angular_frame,
-    )
-    zn, az = get_zn_az(
-        -sat_pos_angref, in_sez=False, latitude=plt[0][0], longitude=plt[0][1]
-    )
+    distances = _get_distance_moon(poss_moonref)
+    distance_sun_moon, distance_sat_moon = distances[:n_poss], distances[n_poss:]
     # phase
-    phase = (180.0 / np.pi) * np.arccos(
-        (
-            sun_pos_moonref[0] * sat_pos_moonref[0]
-            + sun_pos_moonref[1] * sat_pos_moonref[1]
-            + sun_pos_moonref[2] * sat_pos_moonref[2]
+    phase = np.degrees(
+        np.arccos(
+            np.einsum("ni,ni->n", sun_pos_moonref, sat_pos_moonref)
+            / (distance_sat_moon * distance_sun_moon)
         )
-        / (distance_sat_moon * distance_sun_moon)
     )
-    s = get_phase_sign(sel_lon_sun, (sel_lon_sat * np.pi / 180))
-    phase = s * phase
-    return MoonData(
-        dist_sun_moon_au,
-        distance_sun_moon,
-        distance_sat_moon,
+    return (
         sel_lon_sun,
         sel_lat_sun,
         sel_lat_sat,
         sel_lon_sat,
+        distance_sun_moon,
+        distance_sat_moon,
         phase,
-        az,
-        zn,
     )
 
 
@@ -129,15 +122,80 @@ def _get_moon_datas_xyzs(
     target_frame: str,
     angular_frame: str,
     intercept_ellipsoid: bool,
-) -> List[MoonData]:
-    mds = []
-    for xyz, dt in zip(xyzs, dts):
-        et = spice.str2et(dt)
-        md = _get_moon_data_xyzs(
-            xyz, et, source_frame, target_frame, angular_frame, intercept_ellipsoid
+) -> MoonDataBatch:
+    if len(xyzs) == 0:
+        return MoonDataBatch.empty()
+    xyzs = np.asarray(xyzs, dtype=np.float64)
+    ets = _str2ets(dts)
+    sun_pos_moonref, _ = spice.spkpos("SUN", ets, target_frame, "NONE", "MOON")
+    obs_body = "EARTH"
+    if "MOON" in source_frame and "MOON" in target_frame:
+        obs_body = "MOON"
+    moon_pos_satref, _ = spice.spkpos("MOON", ets, source_frame, "NONE", obs_body)
+    rotations = _pxforms(source_frame, target_frame, ets)
+    ang_rotations = _pxforms(source_frame, angular_frame, ets)
+    # set moon center as zero point
+    sat_pos_translate = xyzs - moon_pos_satref
+    sat_pos_moonref = np.einsum("nij,nj->ni", rotations, sat_pos_translate)
+    sat_pos_angref = np.einsum("nij,nj->ni", ang_rotations, sat_pos_translate)
+    (
+        sel_lon_sun,
+        sel_lat_sun,
+        sel_lat_sat,
+        sel_lon_sat,
+        distance_sun_moon,
+        distance_sat_moon,
+        phase,
+    ) = _compute_geometry(sun_pos_moonref, sat_pos_moonref, intercept_ellipsoid)
+    # observer planetographic coordinates, reusing the angular frame rotations
+    if "MOON" in angular_frame and obs_body == "EARTH":
+        # already centered on the moon, with the same offset _change_frames would use
+        poss_angref = sat_pos_angref
+    else:
+        poss_angref = _change_frames(
+            xyzs, source_frame, angular_frame, ets, ang_rotations
         )
-        mds.append(md)
-    return mds
+    plts = _to_planetographic_degrees(poss_angref, obs_body)
+    # zn az
+    bf2tps = _get_bf2tps(plts[:, 0], plts[:, 1])
+    zns, azs = _get_zn_azs_bf2tps(-sat_pos_angref, bf2tps)
+    signs = get_phase_sign(sel_lon_sun, np.radians(sel_lon_sat))
+    return MoonDataBatch(
+        distance_sun_moon / _KM_PER_AU,
+        distance_sun_moon,
+        distance_sat_moon,
+        sel_lon_sun,
+        sel_lat_sun,
+        sel_lat_sat,
+        sel_lon_sat,
+        signs * phase,
+        azs,
+        zns,
+    )
+
+
+def _get_moon_datas_llhs(
+    llhs: List[Tuple[float, float, float]],
+    dts: List[str],
+    body: str,
+    source_planetographic_frame: str,
+    source_rectangular_frame: str,
+    target_frame: str,
+    angular_frame: str,
+    intercept_ellipsoid: bool,
+) -> MoonDataBatch:
+    ets = _str2ets(dts)
+    xyzs = to_rectangular_multiple(
+        llhs, body, ets, source_planetographic_frame, source_rectangular_frame
+    )
+    return _get_moon_datas_xyzs(
+        xyzs,
+        dts,
+        source_rectangular_frame,
+        target_frame,
+        angular_frame,
+        intercept_ellipsoid,
+    )
 
 
 def get_moon_datas_xyzs(
@@ -148,7 +206,9 @@ def get_moon_datas_xyzs(
     target_frame: str = "MOON_ME",
     angular_frame: str = "ITRF93",
     intercept_ellipsoid: bool = True,
-) -> List[MoonData]:
+    num_workers: int = 1,
+    vectorized: bool = False,
+) -> Union[List[MoonData], MoonDataBatch]:
     """Calculation of needed Moon data from SPICE toolbox, without using intermediate custom kernels.
 
     xyzs: list of tuple of 3 floats
@@ -174,20 +234,33 @@ def get_moon_datas_xyzs(
         ellipsoid (SPICE "INTERCEPT/ELLIPSOID" behavior).
         If False, they correspond to the angular direction of the observer as seen
         from the Moon center, without intersecting the lunar surface.
+    num_workers : int
+        Number of worker processes the timestamps are split among. Each worker loads its
+        own copy of the SPICE kernels. By default 1, which computes everything in the
+        current process.
+    vectorized : bool
+        If True, the result is returned as a single `MoonDataBatch`, with one array per
+        quantity, instead of a list of `MoonData`. False by default.
     Returns
     -------
-    list of MoonData
-        List of the calculated MoonDatas
+    list of MoonData | MoonDataBatch
+        The calculated Moon data
     """
     kernels = BASIC_KERNELS + MOON_KERNELS
-    for kernel in kernels:
-        k_path = os.path.join(kernels_path, kernel)
-        furnsh_safer(k_path)
-    mds = _get_moon_datas_xyzs(
-        xyzs, dts, source_frame, target_frame, angular_frame, intercept_ellipsoid
-    )
-    spice.kclear()
-    return mds
+    k_paths = [os.path.join(kernels_path, kernel) for kernel in kernels]
+    dts = dt_to_str(dts)
+    args = (source_frame, target_frame, angular_frame, intercept_ellipsoid)
+    if num_workers > 1:
+        batches_args = [
+            (xyzs[b], dts[b], *args) for b in _split_batches(len(dts), num_workers)
+        ]
+        mds = MoonDataBatch.concatenate(
+            _run_in_processes(_get_moon_datas_xyzs, k_paths, batches_args, num_workers)
+        )
+    else:
+        with SpiceKernelContext(k_paths):
+            mds = _get_moon_datas_xyzs(xyzs, dts, *args)
+    return mds if vectorized else mds.to_list()
 
 
 def get_moon_datas_llhs(
@@ -200,7 +273,9 @@ def get_moon_datas_llhs(
     target_frame: str = "MOON_ME",
     angular_frame: str = "ITRF93",
     intercept_ellipsoid: bool = True,
-) -> List[MoonData]:
+    num_workers: int = 1,
+    vectorized: bool = False,
+) -> Union[List[MoonData], MoonDataBatch]:
     """Calculation of needed Moon data from SPICE toolbox, without using intermediate custom kernels.
     Accepts planetographic coordinates, that will be internally transformed into rectangular ones.
 
@@ -231,29 +306,37 @@ def get_moon_datas_llhs(
         ellipsoid (SPICE "INTERCEPT/ELLIPSOID" behavior).
         If False, they correspond to the angular direction of the observer as seen
         from the Moon center, without intersecting the lunar surface.
+    num_workers : int
+        Number of worker processes the timestamps are split among. Each worker loads its
+        own copy of the SPICE kernels. By default 1, which computes everything in the
+        current process.
+    vectorized : bool
+        If True, the result is returned as a single `MoonDataBatch`, with one array per
+        quantity, instead of a list of `MoonData`. False by default.
     Returns
     -------
-    list of MoonData
-        List of the calculated MoonDatas
+    list of MoonData | MoonDataBatch
+        The calculated Moon data
     """
     kernels = BASIC_KERNELS + MOON_KERNELS
-    for kernel in kernels:
-        k_path = os.path.join(kernels_path, kernel)
-        furnsh_safer(k_path)
-    ets = spice.str2et(dts)
-    xyzs = [
-        to_rectangular_multiple(
-            [llh], body, [et], source_planetographic_frame, source_rectangular_frame
-        )[0]
-        for llh, et in zip(llhs, ets)
-    ]
-    mds = _get_moon_datas_xyzs(
-        xyzs,
-        dts,
+    k_paths = [os.path.join(kernels_path, kernel) for kernel in kernels]
+    dts = dt_to_str(dts)
+    args = (
+        body,
+        source_planetographic_frame,
         source_rectangular_frame,
         target_frame,
         angular_frame,
         intercept_ellipsoid,
     )
-    spice.kclear()
-    return mds
+    if num_workers > 1:
+        batches_args = [
+            (llhs[b], dts[b], *args) for b in _split_batches(len(dts), num_workers)
+        ]
+        mds = MoonDataBatch.concatenate(
+            _run_in_processes(_get_moon_datas_llhs, k_paths, batches_args, num_workers)
+        )
+    else:
+        with SpiceKernelContext(k_paths):
+            mds = _get_moon_datas_llhs(llhs, dts, *args)
+    return mds if vectorized else mds.to_list()
@@ -2,7 +2,7 @@
 Solar related geometries.
 """
 import os
-from typing import Union, List
+from typing import Union, List, Tuple
 from datetime import datetime
 
 import numpy as np
@@ -10,7 +10,54 @@ import spiceypy as spice
 
 from .types import MoonSunData
 from .constants import BASIC_KERNELS, MOON_KERNELS
-from .basics import dt_to_str, furnsh_safer, get_radii_moon
+from .basics import (
+    dt_to_str,
+    get_radii_moon,
+    SpiceKernelContext,
+    _KM_PER_AU,
+    _str2et_cached,
+    _str2ets,
+)
+from .coordinates import limit_planetographic, _recpgr_np
+
+
+def _get_sun_moon_arrays(
+    ets: np.ndarray,
+    ignore_bodvrd: bool = True,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    if len(ets) == 0:
+        return tuple(np.empty(0) for _ in range(4))
+    m_eq_rad, m_pol_rad = get_radii_moon(ignore_bodvrd)
+    flattening = (m_eq_rad - m_pol_rad) / m_eq_rad
+    # Calculate selenographic longitude of sun
+    sun_spoints = [
+        spice.subslr("INTERCEPT/ELLIPSOID", "MOON", et, "MOON_ME", "NONE", "SUN")[0]
+        for et in ets
+    ]
+    lons_sun_rad, lats_sun_rad, _ = _recpgr_np(
+        "MOON", sun_spoints, m_eq_rad, flattening
+    )
+
+    # Calculate the distance between sun and moon (AU)
+    states, _ = spice.spkezr("MOON", ets, "MOON_ME", "NONE", "SUN")
+    dists_sun_moon_km = np.linalg.norm(states[:, :3], axis=1)
+    dists_sun_moon_au = dists_sun_moon_km / _KM_PER_AU
+
+    lats_sun_rad, lons_sun_rad = limit_planetographic(
+        lats_sun_rad, lons_sun_rad, np.pi / 2, np.pi
+    )
+
+    return lons_sun_rad, lats_sun_rad, dists_sun_moon_km, dists_sun_moon_au
+
+
+def _get_sun_moon_datas(
+    ets: np.ndarray,
+    ignore_bodvrd: bool = True,
+) -> List[MoonSunData]:
+    return [
+        MoonSunData(*values)
+        for values in zip(*_get_sun_moon_arrays(ets, ignore_bodvrd))
+    ]
 
 
 def get_sun_moon_data(
@@ -34,35 +81,8 @@ def get_sun_moon_data(
     msd: MoonSunData
         Solar selenographic coordinates at the given timestamp.
     """
-    et_date = spice.str2et(utc_time)
-    m_eq_rad, m_pol_rad = get_radii_moon(ignore_bodvrd)
-    flattening = (m_eq_rad - m_pol_rad) / m_eq_rad
-    # Calculate selenographic longitude of sun
-    sun_spoint, _, _ = spice.subslr(
-        "INTERCEPT/ELLIPSOID", "MOON", et_date, "MOON_ME", "NONE", "SUN"
-    )
-    lon_sun_rad, lat_sun_rad, _ = spice.recpgr("MOON", sun_spoint, m_eq_rad, flattening)
-
-    # Calculate the distance between sun and moon (AU)
-    state, _ = spice.spkezr("MOON", et_date, "MOON_ME", "NONE", "SUN")
-    dist_sun_moon_km = np.sqrt(state[0] ** 2 + state[1] ** 2 + state[2] ** 2)
-    dist_sun_moon_au = spice.convrt(dist_sun_moon_km, "KM", "AU")
-
-    limit_lat_rad = np.pi / 2
-    limit_lon_rad = np.pi
-    if lat_sun_rad > limit_lat_rad:
-        lat_sun_rad = limit_lat_rad + (limit_lat_rad - lat_sun_rad)
-        lon_sun_rad -= limit_lon_rad
-    elif lat_sun_rad < -limit_lat_rad:
-        lat_sun_rad = -limit_lat_rad - (limit_lat_rad + lat_sun_rad)
-        lon_sun_rad += limit_lon_rad
-
-    while lon_sun_rad > limit_lon_rad:
-        lon_sun_rad -= limit_lon_rad * 2
-    while lon_sun_rad < -limit_lon_rad:
-        lon_sun_rad += limit_lon_rad * 2
-
-    return MoonSunData(lon_sun_rad, lat_sun_rad, dist_sun_moon_km, dist_sun_moon_au)
+    et_date = _str2et_cached(utc_time)
+    return _get_sun_moon_datas(np.array([et_date]), ignore_bodvrd)[0]
 
 
 def get_sun_moon_datas(
@@ -88,13 +108,7 @@ def get_sun_moon_datas(
     if len(utc_times) == 0:
         return []
     kernels = BASIC_KERNELS + MOON_KERNELS
-    for kernel in kernels:
-        k_path = os.path.join(kernels_path, kernel)
-        furnsh_safer(k_path)
-
-    msds = []
-    for utc_time in utc_times:
-        msd = get_sun_moon_data(utc_time, ignore_bodvrd)
-        msds.append(msd)
-    spice.kclear()
-    return msds
+    k_paths = [os.path.join(kernels_path, kernel) for kernel in kernels]
+    with SpiceKernelContext(k_paths):
+        ets = _str2ets(utc_times)
+        return _get_sun_moon_datas(ets, ignore_bodvrd)
@@ -2,7 +2,10 @@
 Common and simple data types and data structures.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from typing import List
+
+import numpy as np
 
 
 @dataclass
@@ -65,3 +68,84 @@ class MoonSunData:
     lat_sun_rad: float
     dist_sun_moon_km: float
     dist_sun_moon_au: float
+
+
+@dataclass
+class MoonDataBatch:
+    """
+    Moon data for multiple timestamps, stored as one array per quantity instead of one
+    `MoonData` per timestamp.
+
+    Attributes
+    ----------
+    dist_sun_moon_au : np.ndarray
+        Distances between the Sun and the Moon (in astronomical units)
+    dist_sun_moon_km : np.ndarray
+        Distances between the Sun and the Moon (in kilometers)
+    dist_obs_moon : np.ndarray
+        Distances between the Observer and the Moon (in kilometers)
+    lon_sun_rad : np.ndarray
+        Selenographic longitudes of the Sun (in radians)
+    lat_sun_rad : np.ndarray
+        Selenographic latitudes of the Sun (in radians)
+    lat_obs : np.ndarray
+        Selenographic latitudes of the observer (in degrees)
+    lon_obs : np.ndarray
+        Selenographic longitudes of the observer (in degrees)
+    mpa_deg : np.ndarray
+        Moon phase angles (in degrees)
+    azimuth : np.ndarray
+        Azimuth angles (in degrees)
+    zenith : np.ndarray
+        Zenith angles (in degrees)
+    """
+
+    dist_sun_moon_au: np.ndarray
+    dist_sun_moon_km: np.ndarray
+    dist_obs_moon: np.ndarray
+    lon_sun_rad: np.ndarray
+    lat_sun_rad: np.ndarray
+    lat_obs: np.ndarray
+    lon_obs: np.ndarray
+    mpa_deg: np.ndarray
+    azimuth: np.ndarray
+    zenith: np.ndarray
+
+    def __post_init__(self):
+        lengths = {len(getattr(self, field.name)) for field in fields(self)}
+        if len(lengths) > 1:
+            raise ValueError(
+                "all the quantities of a MoonDataBatch must have the same length"
+            )
+
+    def __eq__(self, other) -> bool:
+        # The generated __eq__ compares the arrays as tuples, which is ambiguous
+        if not isinstance(other, MoonDataBatch):
+            return NotImplemented
+        return all(
+            np.array_equal(getattr(self, field.name), getattr(other, field.name))
+            for field in fields(self)
+        )
+
+    def __len__(self) -> int:
+        return len(self.dist_sun_moon_au)
+
+    def to_list(self) -> List[MoonData]:
+        """Convert the batch into a list of `MoonData`, one per timestamp."""
+        columns = (getattr(self, field.name).tolist() for field in fields(self))
+        return [MoonData(*values) for values in zip(*columns)]
+
+    @classmethod
+    def empty(cls) -> "MoonDataBatch":
+        """Create a batch without any timestamp."""
+        return cls(*(np.empty(0) for _ in fields(cls)))
+
+    @classmethod
+    def concatenate(cls, batches: List["MoonDataBatch"]) -> "MoonDataBatch":
+        """Join several batches into one, keeping their order."""
+        return cls(
+            *(
+                np.concatenate([getattr(batch, field.name) for batch in batches])
+                for field in fields(cls)
+            )
+        )
@@ -1,29 +1,41 @@
 #!/usr/bin/env python3
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Union
 from datetime import datetime, timedelta
-from typing import Tuple
-import math
+import dataclasses
+import os
+import sys
 
 import matplotlib
 import matplotlib.pyplot as plt
+import numpy as np
 
-matplotlib.use("TkAgg")
+# Without a display (CI or batch runs) the Tk toolkit can't be loaded
+_HEADLESS = sys.platform.startswith("linux") and not os.environ.get("DISPLAY")
+matplotlib.use("Agg" if _HEADLESS else "TkAgg")
 
 
 import spicedmoon as spm
 
-
-def _decdeg2dms(dd: float) -> Tuple[int, int, int]:
-    mnt, sec = divmod(dd * 3600, 60)
-    deg, mnt = divmod(mnt, 60)
-    return int(deg), int(mnt), int(sec)
+_MD_FIELDS = tuple(f.name for f in dataclasses.fields(spm.MoonData))
+_FIG = None
+_AXES = None
 
 
 def datetime_range(start, end, delta):
-    current = start
-    while current < end:
-        yield current
-        current += delta
+    # Regular grid built by numpy, converted to naive datetimes in one call
+    return np.arange(
+        np.datetime64(start, "s"),
+        np.datetime64(end, "s"),
+        np.timedelta64(delta, "s"),
+    ).tolist()
+
+
+def _init_worker(kernels_path):
+    # A forked worker must not keep using kernel handles (and file offsets) shared
+    # with its parent, so it starts from an empty pool before loading its own.
+    spm.clear_kernels()
+    spm.load_kernels(kernels_path)
 
 
 def get_spicedmoon_earth(dts_str, lat, lon, alt):
@@ -35,50 +47,94 @@ def get_spicedmoon_earth(dts_str, lat, lon, alt):
 
 def get_spicedmoon_llh(dts_str, lat, lon, alt):
     mds = spm.get_moon_datas_llhs(
-        [(lat, lon, alt / 1000) for _ in range(len(dts_str))],
+        np.broadcast_to(np.array([lat, lon, alt / 1000]), (len(dts_str), 3)),
         dts_str,
         "./kernels",
+        vectorized=True,
     )
     return mds
 
 
 def get_spicedmoon_obs(dts_str, lat, lon, alt):
     mds = spm.get_moon_datas(
-        lat, lon, alt, dts_str, "./kernels", earth_as_zenith_observer=False
+        lat,
+        lon,
+        alt,
+        dts_str,
+        "./kernels",
+        earth_as_zenith_observer=False,
+        vectorized=True,
     )
     return mds
 
 
-def get_reldif(a, b, percent=True):
-    rd = (a - b) / a
-    if percent:
-        return 100 * rd
-    return rd
-
-
-def plot_reldifs(mds0: List[spm.MoonData], mds1: List[spm.MoonData], title: str = ""):
-    vars = [v for v in mds0[0].__dir__() if not v.startswith("_")]
-    mrds = {}
-    for v in vars:
-        rds = []
-        for m0, m1 in zip(mds0, mds1):
-            rd = get_reldif(m0.__dict__[v], m1.__dict__[v], False)
-            rds.append(rd)
-        mrds[v] = rds
-    fig, axes = plt.subplots(2, 5)
-    for i, k in enumerate(mrds):
+def get_reldif(a, b):
+    # Zero where `a` is zero, instead of inf/nan values that would stretch the bins
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    # The division is done in place over the difference, so for long series only
+    # one output array is allocated
+    rd = np.subtract(a, b, out=np.empty_like(a))
+    nonzero = a != 0
+    np.divide(rd, a, out=rd, where=nonzero)
+    rd[~nonzero] = 0.0
+    # Scalars in, float out
+    return rd if rd.ndim else float(rd)
+
+
+def _get_reldifs_fig():
+    # The figure is reused between calls while its window is still open
+    global _FIG, _AXES
+    if _FIG is None or not plt.fignum_exists(_FIG.number):
+        _FIG, _AXES = plt.subplots(2, 5)
+    else:
+        for ax in _AXES.flat:
+            ax.cla()
+    return _FIG, _AXES
+
+
+def to_soa(mds: Union[List[spm.MoonData], spm.MoonDataBatch]) -> Dict[str, np.ndarray]:
+    # One contiguous array per MoonData field
+    if isinstance(mds, spm.MoonDataBatch):
+        return {v: np.asarray(getattr(mds, v), dtype=np.float64) for v in _MD_FIELDS}
+    return {
+        v: np.fromiter((getattr(m, v) for m in mds), dtype=np.float64, count=len(mds))
+        for v in _MD_FIELDS
+    }
+
+
+def plot_reldifs(
+    mds0: Union[List[spm.MoonData], spm.MoonDataBatch],
+    mds1: Union[List[spm.MoonData], spm.MoonDataBatch],
+    title: str = "",
+):
+    soa0, soa1 = to_soa(mds0), to_soa(mds1)
+    rds = {v: get_reldif(soa0[v], soa1[v]) for v in _MD_FIELDS}
+    fig, axes = _get_reldifs_fig()
+    for i, k in enumerate(_MD_FIELDS):
         ax = axes[i // 5][i % 5]
-        ax.hist(mrds[k], bins=15, color="skyblue", edgecolor="black")
+        ax.hist(
+            rds[k],
+            bins=15,
+            range=(rds[k].min(), rds[k].max()),
+            color="skyblue",
+            edgecolor="black",
+        )
         ax.set_axisbelow(True)
         ax.grid(color="gray", linestyle="dashed")
         ax.set_title(k)
     fig.suptitle(title)
-    plt.show()
+    # SPM_SAVE_FIG=path saves the figure instead of opening a window
+    save_path = os.environ.get("SPM_SAVE_FIG")
+    if save_path:
+        fig.savefig(save_path)
+    else:
+        plt.show()
 
 
 def main():
     dts = [
-        dt.strftime("%Y-%m-%d %H:%M:%S")
+        dt.isoformat(sep=" ", timespec="seconds")
         for dt in datetime_range(
             datetime(2022, 4, 1), datetime(2022, 4, 28), timedelta(minutes=30)
         )
@@ -87,8 +143,16 @@ def main():
     lat = 28.309283
     lon = -16.499143
     alt = 2400
-    mds0 = get_spicedmoon_obs(dts, lat, lon, alt)
-    mds1 = get_spicedmoon_llh(dts, lat, lon, alt)
+    # The backends are independent, so each one runs in its own process (SPICE can't
+    # be shared between threads), which loads the kernels into its own pool. Each
+    # worker parses every timestamp once, as its str2et cache survives the reloads of
+    # the custom-body kernel, but the conversions aren't shared between the workers.
+    with ProcessPoolExecutor(
+        max_workers=2, initializer=_init_worker, initargs=("./kernels",)
+    ) as executor:
+        f0 = executor.submit(get_spicedmoon_obs, dts, lat, lon, alt)
+        f1 = executor.submit(get_spicedmoon_llh, dts, lat, lon, alt)
+        mds0, mds1 = f0.result(), f1.result()
     matplotlib.rc("axes.formatter", useoffset=False)
     title = "Rel. Diff. Custom Body VS Direct Geometry"
     plot_reldifs(mds0, mds1, title)
@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Tuple
 import math
+import sys
 
+import numpy as np
 import spicedmoon as spm
 import pylunar
 import ephem
 
 
+@lru_cache(maxsize=128)
 def _decdeg2dms(dd: float) -> Tuple[int, int, int]:
     mnt, sec = divmod(dd * 3600, 60)
     deg, mnt = divmod(mnt, 60)
@@ -15,98 +19,166 @@ def _decdeg2dms(dd: float) -> Tuple[int, int, int]:
 
 
 def datetime_range(start, end, delta):
-    current = start
-    while current < end:
-        yield current
-        current += delta
+    # Regular grid built by numpy, converted to naive datetimes in one call
+    return np.arange(
+        np.datetime64(start, "s"),
+        np.datetime64(end, "s"),
+        np.timedelta64(delta, "s"),
+    ).tolist()
 
 
-def print_result(az, ze):
-    print("{},{}".format(az, ze))
+def format_result(az, ze):
+    return "{},{}\n".format(az, ze)
 
 
-def print_pylunar(dts_str, lat, lon, alt):
-    mi = pylunar.MoonInfo(_decdeg2dms(lat), _decdeg2dms(lon))
-    for dt_s in dts_str:
-        dt = datetime.strptime(dt_s, "%Y-%m-%d %H:%M:%S")
-        mi.update(dt)
-        az = mi.azimuth()
-        ze = 90 - mi.altitude()
-        print_result(az, ze)
+def print_result(az, ze):
+    # Kept for debugging single values, the printers below write all rows at once
+    sys.stdout.write(format_result(az, ze))
+
+
+def _format_details(md):
+    values = (
+        md.mpa_deg,
+        md.dist_obs_moon,
+        md.dist_sun_moon_km,
+        md.lat_obs,
+        md.lon_obs,
+        math.degrees(md.lat_sun_rad),
+        md.lon_sun_rad,
+    )
+    return " ".join(str(v) for v in values) + "\n"
+
+
+def print_pylunar(dts, lat, lon, alt):
+    lat_dms, lon_dms = _decdeg2dms(lat), _decdeg2dms(lon)
+    mi = pylunar.MoonInfo(lat_dms, lon_dms)
+    # MoonInfo.update sets the date of its ephem observer, so the conversion to
+    # ephem dates (Julian-based) can be done once for all timestamps
+    dates = [ephem.Date(dt) for dt in dts]
+    update, azimuth, altitude = mi.update, mi.azimuth, mi.altitude
+    _format_result = format_result
+    rows = []
+    for date in dates:
+        update(date)
+        az = azimuth()
+        ze = 90 - altitude()
+        rows.append(_format_result(az, ze))
+    sys.stdout.write("".join(rows))
 
 
 def print_spicedmoon_earth(dts_str, lat, lon, alt):
     mds = spm.get_moon_datas(
         lat, lon, alt, dts_str, "./kernels", earth_as_zenith_observer=True
     )
-    for md in mds:
-        print_result(md.azimuth, md.zenith)
+    sys.stdout.write("".join(format_result(md.azimuth, md.zenith) for md in mds))
 
 
 def print_spicedmoon_llh(dts_str, lat, lon, alt):
     mds = spm.get_moon_datas_llhs(
-        [(lat, lon, alt / 1000) for _ in range(len(dts_str))], dts_str, "./kernels"
+        np.broadcast_to(np.array([lat, lon, alt / 1000]), (len(dts_str), 3)),
+        dts_str,
+        "./kernels",
     )
+    rows = []
     for md in mds:
-        print_result(md.azimuth, md.zenith)
-        print(
-            md.mpa_deg,
-            md.dist_obs_moon,
-            md.dist_sun_moon_km,
-            md.lat_obs,
-            md.lon_obs,
-            math.degrees(md.lat_sun_rad),
-            md.lon_sun_rad,
-        )
+        rows.append(format_result(md.azimuth, md.zenith))
+        rows.append(_format_details(md))
+    sys.stdout.write("".join(rows))
 
 
 def print_spicedmoon_obs(dts_str, lat, lon, alt):
     mds = spm.get_moon_datas(
         lat, lon, alt, dts_str, "./kernels", earth_as_zenith_observer=False
     )
+    rows = []
     for md in mds:
-        print_result(md.azimuth, md.zenith)
-        print(
-            md.mpa_deg,
-            md.dist_obs_moon,
-            md.dist_sun_moon_km,
-            md.lat_obs,
-            md.lon_obs,
-            math.degrees(md.lat_sun_rad),
-            md.lon_sun_rad,
-        )
+        rows.append(format_result(md.azimuth, md.zenith))
+        rows.append(_format_details(md))
+    sys.stdout.write("".join(rows))
 
 
-def print_ephem(dts_str, lat, lon, alt):
+def print_ephem(dts, lat, lon, alt):
+    obs = ephem.Observer()
+    obs.lat = math.radians(lat)
+    obs.long = math.radians(lon)
+    m = ephem.Moon()
+    dates = [ephem.Date(dt) for dt in dts]
+    degrees = math.degrees
+    compute = m.compute
+    _format_result = format_result
+    rows = []
+    for date in dates:
+        obs.date = date
+        compute(obs)
+        az = degrees(m.az)
+        ze = 90 - degrees(m.alt)
+        rows.append(_format_result(az, ze))
+    sys.stdout.write("".join(rows))
+
+
+def print_backends(dts, mds, lat, lon):
+    # Azimuth and zenith of spicedmoon (`mds`, already computed for `dts`), pylunar
+    # and ephem side by side, in a single pass over the timestamps
+    mi = pylunar.MoonInfo(_decdeg2dms(lat), _decdeg2dms(lon))
     obs = ephem.Observer()
     obs.lat = math.radians(lat)
     obs.long = math.radians(lon)
     m = ephem.Moon()
-    for dt_s in dts_str:
-        dt = datetime.strptime(dt_s, "%Y-%m-%d %H:%M:%S")
-        obs.date = dt
-        m.compute(obs)
-        az = math.degrees(m.az)
-        ze = 90 - math.degrees(m.alt)
-        print_result(az, ze)
+    dates = [ephem.Date(dt) for dt in dts]
+    update, azimuth, altitude = mi.update, mi.azimuth, mi.altitude
+    degrees = math.degrees
+    compute = m.compute
+    rows = []
+    for md, date in zip(mds, dates):
+        update(date)
+        obs.date = date
+        compute(obs)
+        rows.append(
+            "{},{},{},{},{},{}\n".format(
+                md.azimuth,
+                md.zenith,
+                azimuth(),
+                90 - altitude(),
+                degrees(m.az),
+                90 - degrees(m.alt),
+            )
+        )
+        rows.append(_format_details(md))
+    sys.stdout.write("".join(rows))
+
+
+_PRINTERS = {
+    "pylunar": print_pylunar,
+    "ephem": print_ephem,
+    "spicedmoon_earth": print_spicedmoon_earth,
+    "spicedmoon_obs": print_spicedmoon_obs,
+    "spicedmoon_llh": print_spicedmoon_llh,
+}
 
 
 def main():
-    dts = [
-        dt.strftime("%Y-%m-%d %H:%M:%S")
-        for dt in datetime_range(
-            datetime(2022, 4, 22, 0), datetime(2022, 4, 22, 6), timedelta(minutes=30)
-        )
-    ]
+    dts = datetime_range(
+        datetime(2022, 4, 22, 0), datetime(2022, 4, 22, 6), timedelta(minutes=30)
+    )
+    # The datetimes are naive, so spicedmoon gets them as UTC strings
+    dts_str = [dt.isoformat(sep=" ", timespec="seconds") for dt in dts]
     # izana
     lat = 28.309283
     lon = -16.499143
     alt = 2400
-    print_ephem(dts, lat, lon, alt)
-    print()
-    print_spicedmoon_obs(dts, lat, lon, alt)
-    print()
-    print_spicedmoon_llh(dts, lat, lon, alt)
+    # A backend name as argument prints only that backend
+    backend = sys.argv[1] if len(sys.argv) > 1 else None
+    if backend in ("pylunar", "ephem"):
+        _PRINTERS[backend](dts, lat, lon, alt)
+    elif backend is not None:
+        _PRINTERS[backend](dts_str, lat, lon, alt)
+    else:
+        mds = spm.get_moon_datas(
+            lat, lon, alt, dts_str, "./kernels", earth_as_zenith_observer=False
+        )
+        print_backends(dts, mds, lat, lon)
+        print()
+        print_spicedmoon_llh(dts_str, lat, lon, alt)
 
 
 if __name__ == "__main__":
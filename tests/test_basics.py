@@ -0,0 +1,141 @@
+import numpy as np
+import pytest
+import spiceypy as spice
+
+from spicedmoon import basics
+from spicedmoon.basics import SpiceKernelContext, clear_kernels, load_kernels
+from spicedmoon.constants import BASIC_KERNELS, MOON_KERNELS
+
+_UTC = "2022-01-17 00:00:00"
+
+
+@pytest.fixture(autouse=True)
+def _clean_pool():
+    clear_kernels()
+    yield
+    clear_kernels()
+
+
+def _write_text_kernel(path, data: str) -> str:
+    with open(path, "w") as fp:
+        fp.write("KPL/FK\n\\begindata\n{}\n\\begintext\n".format(data))
+    return str(path)
+
+
+def _write_lsk(path, delta_at: int) -> str:
+    # Minimal leapseconds kernel, with a single step in TAI - UTC
+    data = "\n".join(
+        (
+            "DELTET/DELTA_T_A = 32.184",
+            "DELTET/K = 1.657D-3",
+            "DELTET/EB = 1.671D-2",
+            "DELTET/M = ( 6.239996D0 1.99096871D-7 )",
+            "DELTET/DELTA_AT = ( 10, @1972-JAN-1 {}, @2017-JAN-1 )".format(delta_at),
+        )
+    )
+    return _write_text_kernel(path, data)
+
+
+def _write_spk(path) -> str:
+    # Body -1000 at rest relative to the Earth for the first day after J2000
+    handle = spice.spkopn(str(path), "TEST", 0)
+    states = np.tile([7000.0, 0.0, 0.0, 0.0, 0.0, 0.0], (3, 1))
+    spice.spkw08(
+        handle, -1000, 399, "J2000", 0.0, 86400.0, "TEST", 1, 3, states, 0.0, 43200.0
+    )
+    spice.spkcls(handle)
+    return str(path)
+
+
+def test_nested_contexts(tmp_path):
+    k0 = _write_text_kernel(tmp_path / "k0.tf", "TEST_K0 = 0")
+    k1 = _write_text_kernel(tmp_path / "k1.tf", "TEST_K1 = 1")
+    with SpiceKernelContext([k0]):
+        assert spice.ktotal("ALL") == 1
+        with SpiceKernelContext([k0, k1]):
+            assert SpiceKernelContext._depth == 2
+            assert spice.ktotal("ALL") == 2
+        assert SpiceKernelContext._depth == 1
+        assert spice.ktotal("ALL") == 2
+    assert SpiceKernelContext._depth == 0
+    assert spice.ktotal("ALL") == 0
+
+
+def test_context_exits_on_error(tmp_path):
+    k0 = _write_text_kernel(tmp_path / "k0.tf", "TEST_K0 = 0")
+    with pytest.raises(RuntimeError):
+        with SpiceKernelContext([k0]):
+            raise RuntimeError
+    assert SpiceKernelContext._depth == 0
+    assert spice.ktotal("ALL") == 0
+
+
+def test_context_without_clear_on_exit(tmp_path):
+    k0 = _write_text_kernel(tmp_path / "k0.tf", "TEST_K0 = 0")
+    with SpiceKernelContext([k0], clear_on_exit=False):
+        pass
+    assert spice.ktotal("ALL") == 1
+
+
+def test_load_and_clear_kernels(tmp_path):
+    # Text stand-ins with the names of the kernels load_kernels looks for
+    k_paths = [
+        _write_text_kernel(tmp_path / kernel, "TEST_K{} = {}".format(i, i))
+        for i, kernel in enumerate(BASIC_KERNELS + MOON_KERNELS)
+    ]
+    extra = _write_text_kernel(tmp_path / "extra.tf", "TEST_EXTRA = 1")
+    load_kernels(str(tmp_path), [extra])
+    assert SpiceKernelContext._keep_loaded
+    assert spice.ktotal("ALL") == len(k_paths) + 1
+    with SpiceKernelContext(k_paths):
+        pass
+    assert SpiceKernelContext._depth == 0
+    assert spice.ktotal("ALL") == len(k_paths) + 1
+    clear_kernels()
+    assert not SpiceKernelContext._keep_loaded
+    assert spice.ktotal("ALL") == 0
+    with SpiceKernelContext(k_paths):
+        assert spice.ktotal("ALL") == len(k_paths)
+    assert spice.ktotal("ALL") == 0
+
+
+def test_str2et_cache(tmp_path):
+    lsk37 = _write_lsk(tmp_path / "lsk37.tls", 37)
+    lsk38 = _write_lsk(tmp_path / "lsk38.tls", 38)
+    spk = _write_spk(tmp_path / "test.bsp")
+    with SpiceKernelContext([lsk37]):
+        et37 = basics._str2ets([_UTC])[0]
+        assert basics._str2et_cached.cache_info().currsize == 1
+        # SPKs can't change the conversions, so they keep the cache
+        basics.furnsh_safer(spk)
+        basics._unload(spk)
+        basics._str2ets([_UTC])
+        assert basics._str2et_cached.cache_info().hits == 1
+        basics._unload(lsk37)
+        basics.furnsh_safer(lsk38)
+        assert basics._str2et_cached.cache_info().currsize == 0
+        assert basics._str2ets([_UTC])[0] == et37 + 1
+    assert basics._str2et_cached.cache_info().currsize == 0
+
+
+def test_pxform_cache(tmp_path):
+    frame = _write_text_kernel(tmp_path / "frame.tf", "TEST_FRAME = 1")
+    spk = _write_spk(tmp_path / "test.bsp")
+    with SpiceKernelContext([spk]):
+        basics._pxform_cached("J2000", "ECLIPJ2000", 0.0)
+        with SpiceKernelContext([_write_spk(tmp_path / "other.bsp")]):
+            assert basics._pxform_cached.cache_info().currsize == 1
+        with SpiceKernelContext([frame]):
+            assert basics._pxform_cached.cache_info().currsize == 0
+
+
+def test_kernels_changed_outside(tmp_path):
+    k0 = _write_text_kernel(tmp_path / "k0.tf", "TEST_K0 = 0")
+    lsk = _write_lsk(tmp_path / "lsk.tls", 37)
+    with SpiceKernelContext([lsk]):
+        basics._str2ets([_UTC])
+        basics._pxform_cached("J2000", "ECLIPJ2000", 0.0)
+        spice.furnsh(k0)
+        with SpiceKernelContext([]):
+            assert basics._str2et_cached.cache_info().currsize == 0
+            assert basics._pxform_cached.cache_info().currsize == 0
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+import spiceypy as spice
+
+from spicedmoon.coordinates import _pgrrec_np, _recpgr_np
+
+# (body, equatorial radius, polar radius); MARS has west-positive planetographic longitudes
+_BODIES = [
+    ("EARTH", 6378.1366, 6356.7519),
+    ("MOON", 1738.1, 1736.0),
+    ("MARS", 3396.19, 3376.2),
+]
+
+
+@pytest.fixture(autouse=True)
+def _prime_meridians():
+    # recpgr only needs the prime meridian rates to know the longitude sense
+    spice.pdpool("BODY301_PM", [38.3213, 13.17635815, -1.4e-12])
+    spice.pdpool("BODY499_PM", [176.63, 350.89198226, 0.0])
+    yield
+    spice.kclear()
+
+
+def _geodetics(n: int = 200):
+    rng = np.random.default_rng(0)
+    lons = rng.uniform(0, 2 * np.pi, n)
+    lats = rng.uniform(-np.pi / 2, np.pi / 2, n)
+    return lons, lats
+
+
+@pytest.mark.parametrize("body, eq_rad, pol_rad", _BODIES)
+@pytest.mark.parametrize("alt", [0.0, 1e5])
+def test_pgrrec_np(body, eq_rad, pol_rad, alt):
+    flattening = (eq_rad - pol_rad) / eq_rad
+    lons, lats = _geodetics()
+    alts = np.full(lons.shape, alt)
+    rectans = _pgrrec_np(body, lons, lats, alts, eq_rad, flattening)
+    expected = [
+        spice.pgrrec(body, lon, lat, alt, eq_rad, flattening)
+        for lon, lat in zip(lons, lats)
+    ]
+    np.testing.assert_allclose(rectans, expected, rtol=1e-12, atol=1e-8)
+
+
+@pytest.mark.parametrize("body, eq_rad, pol_rad", _BODIES)
+@pytest.mark.parametrize("alt", [0.0, 1e5])
+def test_recpgr_np(body, eq_rad, pol_rad, alt):
+    flattening = (eq_rad - pol_rad) / eq_rad
+    lons, lats = _geodetics()
+    rectans = np.array(
+        [
+            spice.pgrrec(body, lon, lat, alt, eq_rad, flattening)
+            for lon, lat in zip(lons, lats)
+        ]
+    )
+    _check_recpgr(body, rectans, eq_rad, flattening)
+
+
+@pytest.mark.parametrize("body, eq_rad, pol_rad", _BODIES)
+def test_recpgr_np_near_centre(body, eq_rad, pol_rad):
+    flattening = (eq_rad - pol_rad) / eq_rad
+    rng = np.random.default_rng(0)
+    e2_rad = flattening * (2 - flattening) * eq_rad
+    rectans = np.vstack(
+        (
+            [[3.0, 0.0, 0.0], [1e-6, 0.0, 0.0], [0.0, 0.0, 0.0], [3.0, 1.0, -0.5]],
+            rng.uniform(-10 * e2_rad, 10 * e2_rad, (500, 3)),
+        )
+    )
+    _check_recpgr(body, rectans, eq_rad, flattening)
+
+
+def _check_recpgr(body, rectans, eq_rad, flattening):
+    lons, lats, alts = _recpgr_np(body, rectans, eq_rad, flattening)
+    expected = np.array(
+        [spice.recpgr(body, rectan, eq_rad, flattening) for rectan in rectans]
+    )
+    dlons = np.angle(np.exp(1j * (lons - expected[:, 0])))
+    # Longitudes are undefined on the rotation axis
+    on_axis = np.hypot(rectans[:, 0], rectans[:, 1]) == 0
+    np.testing.assert_allclose(dlons[~on_axis], 0, atol=1e-10)
+    np.testing.assert_allclose(lats, expected[:, 1], atol=1e-10)
+    np.testing.assert_allclose(alts, expected[:, 2], rtol=1e-12, atol=1e-6)
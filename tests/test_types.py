@@ -0,0 +1,52 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+from spicedmoon.types import MoonData, MoonDataBatch
+
+_N_FIELDS = len(dataclasses.fields(MoonDataBatch))
+
+
+def _batch(n: int, start: float = 0.0) -> MoonDataBatch:
+    return MoonDataBatch(
+        *(start + np.arange(n, dtype=np.float64) + i / 10 for i in range(_N_FIELDS))
+    )
+
+
+def test_to_list_round_trip():
+    batch = _batch(4)
+    mds = batch.to_list()
+    assert len(mds) == len(batch) == 4
+    assert all(isinstance(md, MoonData) for md in mds)
+    assert all(isinstance(v, float) for v in dataclasses.astuple(mds[1]))
+    assert mds[2] == MoonData(*(2 + i / 10 for i in range(_N_FIELDS)))
+    columns = zip(*(dataclasses.astuple(md) for md in mds))
+    assert MoonDataBatch(*(np.array(column) for column in columns)) == batch
+
+
+def test_empty():
+    batch = MoonDataBatch.empty()
+    assert len(batch) == 0
+    assert batch.to_list() == []
+    assert batch == MoonDataBatch.empty()
+
+
+def test_concatenate():
+    batch = MoonDataBatch.concatenate([_batch(2), MoonDataBatch.empty(), _batch(3, 2)])
+    assert len(batch) == 5
+    assert batch == MoonDataBatch.concatenate([_batch(5)])
+    np.testing.assert_array_equal(batch.zenith, np.arange(5) + 0.9)
+
+
+def test_eq():
+    assert _batch(3) == _batch(3)
+    assert _batch(3) != _batch(3, 1)
+    assert _batch(3) != _batch(2)
+    assert _batch(1) != _batch(1).to_list()[0]
+
+
+def test_mismatched_lengths():
+    columns = [np.zeros(3)] * (_N_FIELDS - 1) + [np.zeros(2)]
+    with pytest.raises(ValueError):
+        MoonDataBatch(*columns)